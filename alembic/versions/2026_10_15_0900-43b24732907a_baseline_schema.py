@@ -0,0 +1,126 @@
+"""baseline schema
+
+The schema as first released, when tables were created with
+``Base.metadata.create_all``. Tables that already exist are left alone, so
+databases created before migrations were introduced can run
+``alembic upgrade head`` directly.
+
+Revision ID: 43b24732907a
+Revises:
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '43b24732907a'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return (
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+    )
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'domains' not in existing:
+        op.create_table(
+            'domains',
+            sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column('code', sa.String(10), nullable=False),
+            sa.Column('name', sa.String(100), nullable=False),
+            sa.Column('description', sa.Text()),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            *_timestamps(),
+        )
+        op.create_index('ix_domains_code', 'domains', ['code'], unique=True)
+
+    if 'value_streams' not in existing:
+        op.create_table(
+            'value_streams',
+            sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column('domain_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('domains.id'), nullable=False),
+            sa.Column('code', sa.String(20), nullable=False),
+            sa.Column('name', sa.String(100), nullable=False),
+            sa.Column('description', sa.Text()),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            *_timestamps(),
+            sa.UniqueConstraint('domain_id', 'code', name='uq_value_stream_domain_code'),
+        )
+        op.create_index('ix_value_streams_code', 'value_streams', ['code'])
+        op.create_index('ix_value_stream_domain_code', 'value_streams', ['domain_id', 'code'])
+
+    if 'zones' not in existing:
+        op.create_table(
+            'zones',
+            sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column('value_stream_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('value_streams.id'), nullable=False),
+            sa.Column('name', sa.String(100), nullable=False),
+            sa.Column('security_type', sa.String(20), nullable=False),
+            sa.Column('zone_manager', sa.String(100)),
+            sa.Column('description', sa.Text()),
+            sa.Column('last_firewall_check', sa.DateTime(timezone=True)),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            *_timestamps(),
+            sa.CheckConstraint(
+                "security_type IN ('SL3', 'MFZ_SL4', 'LOG_SL4', 'FMZ_SL4', 'ENG_SL4', 'LRSZ_SL4', 'RSZ_SL4')",
+                name='ck_zone_security_type'
+            ),
+        )
+        op.create_index('ix_zone_security_type', 'zones', ['security_type'])
+        op.create_index('ix_zone_value_stream', 'zones', ['value_stream_id'])
+
+    if 'vlans' not in existing:
+        op.create_table(
+            'vlans',
+            sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column('zone_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('zones.id'), nullable=False),
+            sa.Column('vlan_id', sa.Integer(), nullable=False),
+            sa.Column('subnet', postgresql.INET(), nullable=False),
+            sa.Column('netmask', sa.String(15), nullable=False),
+            sa.Column('default_gateway', postgresql.INET(), nullable=False),
+            sa.Column('net_start', postgresql.INET(), nullable=False),
+            sa.Column('net_end', postgresql.INET(), nullable=False),
+            sa.Column('description', sa.Text()),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            *_timestamps(),
+            sa.UniqueConstraint('vlan_id', name='uq_vlan_id'),
+            sa.CheckConstraint('vlan_id >= 1 AND vlan_id <= 4094', name='ck_vlan_id_range'),
+        )
+        op.create_index('ix_vlan_zone', 'vlans', ['zone_id'])
+        op.create_index('ix_vlan_subnet', 'vlans', ['subnet'])
+
+    if 'ip_assignments' not in existing:
+        op.create_table(
+            'ip_assignments',
+            sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column('vlan_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('vlans.id'), nullable=False),
+            sa.Column('ip_address', postgresql.INET(), nullable=False),
+            sa.Column('mac_address', postgresql.MACADDR()),
+            sa.Column('ci_name', sa.String(100), nullable=False),
+            sa.Column('description', sa.Text()),
+            sa.Column('is_reserved', sa.Boolean(), nullable=False),
+            sa.Column('assigned_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column('last_seen', sa.DateTime(timezone=True)),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            *_timestamps(),
+            sa.UniqueConstraint('ip_address', name='uq_ip_address'),
+            sa.UniqueConstraint('mac_address', name='uq_mac_address'),
+        )
+        op.create_index('ix_ip_vlan', 'ip_assignments', ['vlan_id'])
+        op.create_index('ix_ip_address', 'ip_assignments', ['ip_address'])
+        op.create_index('ix_ci_name', 'ip_assignments', ['ci_name'])
+
+
+def downgrade() -> None:
+    for table in ('ip_assignments', 'vlans', 'zones', 'value_streams', 'domains'):
+        op.drop_table(table)
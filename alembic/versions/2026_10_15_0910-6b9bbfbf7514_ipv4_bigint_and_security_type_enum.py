@@ -0,0 +1,111 @@
+"""ipv4 bigint and security type enum
+
+Converts ``ip_assignments.ip_address`` and ``vlans.subnet`` from INET to the
+BIGINT form ``IPv4Integer`` stores, and ``zones.security_type`` from a
+checked VARCHAR to the native ``security_type`` ENUM. The per-VLAN lookup
+indexes are replaced by the covering ``ix_ip_vlan_active_addr``.
+
+Every step checks the live schema first: ``create_all`` from the current
+models (application startup, ``scripts/run_dev.py``) may already have
+created some or all of this.
+
+Revision ID: 6b9bbfbf7514
+Revises: 43b24732907a
+Create Date: 2026-10-15 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '6b9bbfbf7514'
+down_revision = '43b24732907a'
+branch_labels = None
+depends_on = None
+
+SECURITY_TYPES = ('SL3', 'MFZ_SL4', 'LOG_SL4', 'FMZ_SL4', 'ENG_SL4', 'LRSZ_SL4', 'RSZ_SL4')
+
+# scripts/init-db.sql may have created the type already, hence checkfirst below
+security_type_enum = postgresql.ENUM(*SECURITY_TYPES, name='security_type', create_type=False)
+
+# (table, column) pairs stored as IPv4Integer
+IPV4_COLUMNS = (('ip_assignments', 'ip_address'), ('vlans', 'subnet'))
+
+
+def _column_type(inspector, table, column):
+    return next(c['type'] for c in inspector.get_columns(table) if c['name'] == column)
+
+
+def _index_names(inspector, table):
+    return {index['name'] for index in inspector.get_indexes(table)}
+
+
+def _check_names(inspector, table):
+    return {check['name'] for check in inspector.get_check_constraints(table)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    # INET - '0.0.0.0' is the address as a bigint; indexes and the unique
+    # constraint on the column are rebuilt by ALTER TYPE
+    for table, column in IPV4_COLUMNS:
+        if isinstance(_column_type(inspector, table, column), postgresql.INET):
+            op.alter_column(
+                table, column,
+                type_=sa.BigInteger(),
+                postgresql_using=f"({column} - '0.0.0.0'::inet)"
+            )
+    if 'ck_ip_address_ipv4' not in _check_names(inspector, 'ip_assignments'):
+        op.create_check_constraint(
+            'ck_ip_address_ipv4', 'ip_assignments', 'ip_address BETWEEN 0 AND 4294967295'
+        )
+
+    security_type_enum.create(bind, checkfirst=True)
+    if not isinstance(_column_type(inspector, 'zones', 'security_type'), sa.Enum):
+        # The ENUM enforces the value set the CHECK constraint used to
+        if 'ck_zone_security_type' in _check_names(inspector, 'zones'):
+            op.drop_constraint('ck_zone_security_type', 'zones', type_='check')
+        op.alter_column(
+            'zones', 'security_type',
+            type_=security_type_enum,
+            postgresql_using='security_type::security_type'
+        )
+
+    indexes = _index_names(inspector, 'ip_assignments')
+    for name in ('ix_ip_vlan', 'ix_ip_address'):
+        if name in indexes:
+            op.drop_index(name, table_name='ip_assignments')
+    if 'ix_ip_vlan_active_addr' not in indexes:
+        op.create_index(
+            'ix_ip_vlan_active_addr', 'ip_assignments', ['vlan_id', 'is_active', 'ip_address'],
+            postgresql_include=['is_reserved']
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ip_vlan_active_addr', table_name='ip_assignments')
+    op.create_index('ix_ip_vlan', 'ip_assignments', ['vlan_id'])
+    op.create_index('ix_ip_address', 'ip_assignments', ['ip_address'])
+
+    op.alter_column(
+        'zones', 'security_type',
+        type_=sa.String(20),
+        postgresql_using='security_type::text'
+    )
+    op.create_check_constraint(
+        'ck_zone_security_type', 'zones',
+        f"security_type IN ({', '.join(repr(value) for value in SECURITY_TYPES)})"
+    )
+    security_type_enum.drop(op.get_bind(), checkfirst=True)
+
+    op.drop_constraint('ck_ip_address_ipv4', 'ip_assignments', type_='check')
+    for table, column in IPV4_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.INET(),
+            postgresql_using=f"('0.0.0.0'::inet + {column})"
+        )
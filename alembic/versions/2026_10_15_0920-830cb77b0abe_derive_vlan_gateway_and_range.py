@@ -0,0 +1,63 @@
+"""derive vlan gateway and range
+
+Replaces the stored ``default_gateway``, ``net_start`` and ``net_end``
+columns, which the VLAN model now derives from ``subnet``/``netmask``, with
+``network_end`` (last address of the subnet) for the overlap check.
+Existing rows are backfilled from ``subnet`` and ``netmask``.
+
+Like the previous revision, each step checks the live schema first.
+
+Revision ID: 830cb77b0abe
+Revises: 6b9bbfbf7514
+Create Date: 2026-10-15 09:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '830cb77b0abe'
+down_revision = '6b9bbfbf7514'
+branch_labels = None
+depends_on = None
+
+DERIVED_COLUMNS = ('default_gateway', 'net_start', 'net_end')
+
+# Subnet size from netmask, which is stored either as "/24" or as "255.255.255.0"
+SUBNET_SIZE = """
+    CASE WHEN netmask LIKE '/%'
+        THEN 1::bigint << (32 - substring(netmask from 2)::int)
+        ELSE 4294967296 - (netmask::inet - '0.0.0.0'::inet)
+    END
+"""
+
+
+def upgrade() -> None:
+    columns = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('vlans')}
+
+    if 'network_end' not in columns:
+        op.add_column('vlans', sa.Column('network_end', sa.BigInteger(), nullable=True))
+        op.execute(f"UPDATE vlans SET network_end = subnet + {SUBNET_SIZE} - 1")
+        op.alter_column('vlans', 'network_end', nullable=False)
+
+    for column in DERIVED_COLUMNS:
+        if column in columns:
+            op.drop_column('vlans', column)
+
+
+def downgrade() -> None:
+    for column in DERIVED_COLUMNS:
+        op.add_column('vlans', sa.Column(column, postgresql.INET(), nullable=True))
+    # Offsets as released: gateway is the first host, 6 reserved addresses follow
+    # it, and the last host before the broadcast address is reserved as well
+    op.execute(
+        "UPDATE vlans SET"
+        " default_gateway = '0.0.0.0'::inet + (subnet + 1),"
+        " net_start = '0.0.0.0'::inet + (subnet + 7),"
+        " net_end = '0.0.0.0'::inet + (network_end - 2)"
+    )
+    for column in DERIVED_COLUMNS:
+        op.alter_column('vlans', column, nullable=False)
+    op.drop_column('vlans', 'network_end')
@@ -83,13 +83,13 @@ async def create_sample_data():
         domains = {}
         for domain_data in domains_data:
             try:
-                domain = await service.create_domain(DomainCreate(**domain_data))
+                domain = service.create_domain(DomainCreate(**domain_data))
                 domains[domain.code] = domain
                 logger.info(f"✅ Created domain: {domain.code} - {domain.name}")
             except Exception as e:
                 logger.warning(f"⚠️  Domain {domain_data['code']} may already exist: {e}")
                 # Try to get existing domain
-                existing_domains = await service.list_domains(active_only=False)
+                existing_domains = service.list_domains(active_only=False)
                 for existing in existing_domains:
                     if existing.code == domain_data['code']:
                         domains[existing.code] = existing
@@ -122,7 +122,7 @@ async def create_sample_data():
             domain_code = vs_data.pop("domain")
             if domain_code in domains:
                 try:
-                    vs = await service.create_value_stream(ValueStreamCreate(
+                    vs = service.create_value_stream(ValueStreamCreate(
                         domain_id=domains[domain_code].id,
                         **vs_data
                     ))
@@ -162,7 +162,7 @@ async def create_sample_data():
             vs_key = zone_data.pop("vs")
             if vs_key in value_streams:
                 try:
-                    zone = await service.create_zone(ZoneCreate(
+                    zone = service.create_zone(ZoneCreate(
                         value_stream_id=value_streams[vs_key].id,
                         **zone_data
                     ))
@@ -202,7 +202,7 @@ async def create_sample_data():
             zone_key = vlan_data.pop("zone_key")
             if zone_key in zones:
                 try:
-                    vlan = await service.create_vlan(VLANCreate(
+                    vlan = service.create_vlan(VLANCreate(
                         zone_id=zones[zone_key].id,
                         **vlan_data
                     ))
@@ -244,7 +244,7 @@ async def create_sample_data():
             vlan_key = ip_data.pop("vlan")
             if vlan_key in vlans:
                 try:
-                    assignment = await service.assign_ip(IPAssignmentCreate(
+                    assignment = service.assign_ip(IPAssignmentCreate(
                         vlan_id=vlans[vlan_key].id,
                         ip_address=ip_data["ip"],
                         mac_address=ip_data["mac"],
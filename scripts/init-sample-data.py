@@ -41,7 +41,7 @@ async def create_sample_data():
         
         domains = {}
         for domain_data in domains_data:
-            domain = await service.create_domain(DomainCreate(**domain_data))
+            domain = service.create_domain(DomainCreate(**domain_data))
             domains[domain.code] = domain
             print(f"✅ Created domain: {domain.code} - {domain.name}")
         
@@ -69,7 +69,7 @@ async def create_sample_data():
         value_streams = {}
         for vs_data in value_streams_data:
             domain_code = vs_data.pop("domain")
-            vs = await service.create_value_stream(ValueStreamCreate(
+            vs = service.create_value_stream(ValueStreamCreate(
                 domain_id=domains[domain_code].id,
                 **vs_data
             ))
@@ -105,7 +105,7 @@ async def create_sample_data():
         zones = {}
         for zone_data in zones_data:
             vs_key = zone_data.pop("vs")
-            zone = await service.create_zone(ZoneCreate(
+            zone = service.create_zone(ZoneCreate(
                 value_stream_id=value_streams[vs_key].id,
                 **zone_data
             ))
@@ -142,7 +142,7 @@ async def create_sample_data():
         for vlan_data in vlans_data:
             zone_key = vlan_data.pop("zone_key")
             if zone_key in zones:
-                vlan = await service.create_vlan(VLANCreate(
+                vlan = service.create_vlan(VLANCreate(
                     zone_id=zones[zone_key].id,
                     **vlan_data
                 ))
@@ -180,7 +180,7 @@ async def create_sample_data():
         for ip_data in ip_assignments_data:
             vlan_key = ip_data.pop("vlan")
             if vlan_key in vlans:
-                assignment = await service.assign_ip(IPAssignmentCreate(
+                assignment = service.assign_ip(IPAssignmentCreate(
                     vlan_id=vlans[vlan_key].id,
                     ip_address=ip_data["ip"],
                     mac_address=ip_data["mac"],
@@ -99,9 +99,9 @@ class LiveTestRunner:
         
         try:
             # Clean up any existing test data
-            existing = await self.service.get_domain_by_code("TEST")
+            existing = self.service.get_domain_by_code("TEST")
             if existing:
-                await self.service.delete_domain(existing.id)
+                self.service.delete_domain(existing.id)
             
             # Test domain creation
             domain_data = DomainCreate(
@@ -111,29 +111,29 @@ class LiveTestRunner:
                 is_active=True
             )
             
-            domain = await self.service.create_domain(domain_data)
+            domain = self.service.create_domain(domain_data)
             assert domain.code == "TEST"
             assert domain.name == "Test Domain"
             assert domain.is_active == True
             
             # Test domain retrieval
-            retrieved = await self.service.get_domain_by_id(domain.id)
+            retrieved = self.service.get_domain_by_id(domain.id)
             assert retrieved.id == domain.id
             
             # Test domain listing
-            domains = await self.service.list_domains()
+            domains = self.service.list_domains()
             test_domain_found = any(d.code == "TEST" for d in domains)
             assert test_domain_found
             
             # Test duplicate prevention
             try:
-                await self.service.create_domain(domain_data)
+                self.service.create_domain(domain_data)
                 assert False, "Should have prevented duplicate domain"
             except VLANConfigurationError:
                 pass  # Expected
             
             # Clean up
-            await self.service.delete_domain(domain.id)
+            self.service.delete_domain(domain.id)
             
             return {
                 "name": test_name,
@@ -168,11 +168,11 @@ class LiveTestRunner:
             )
             
             # Clean up existing
-            existing = await self.service.get_domain_by_code("PERF")
+            existing = self.service.get_domain_by_code("PERF")
             if existing:
-                await self.service.delete_domain(existing.id)
+                self.service.delete_domain(existing.id)
             
-            domain = await self.service.create_domain(domain_data)
+            domain = self.service.create_domain(domain_data)
             
             vs_data = ValueStreamCreate(
                 domain_id=domain.id,
@@ -181,7 +181,7 @@ class LiveTestRunner:
                 description="Performance test value stream",
                 is_active=True
             )
-            value_stream = await self.service.create_value_stream(vs_data)
+            value_stream = self.service.create_value_stream(vs_data)
             
             zone_data = ZoneCreate(
                 value_stream_id=value_stream.id,
@@ -191,7 +191,7 @@ class LiveTestRunner:
                 description="Performance test zone",
                 is_active=True
             )
-            zone = await self.service.create_zone(zone_data)
+            zone = self.service.create_zone(zone_data)
             
             # Performance test: Create VLAN with large subnet
             perf_start = time.time()
@@ -205,7 +205,7 @@ class LiveTestRunner:
                 is_active=True
             )
             
-            vlan = await self.service.create_vlan(vlan_data)
+            vlan = self.service.create_vlan(vlan_data)
             perf_end = time.time()
             
             creation_time = perf_end - perf_start
@@ -219,7 +219,7 @@ class LiveTestRunner:
             assert creation_time < 1.0, f"VLAN creation took {creation_time:.3f}s, requirement is <1s"
             
             # Clean up
-            await self.service.delete_domain(domain.id)
+            self.service.delete_domain(domain.id)
             
             return {
                 "name": test_name,
@@ -247,7 +247,7 @@ class LiveTestRunner:
         
         try:
             # Use existing sample data if available
-            domains = await self.service.list_domains()
+            domains = self.service.list_domains()
             if not domains:
                 return {
                     "name": test_name,
@@ -300,7 +300,7 @@ class LiveTestRunner:
                 is_active=True
             )
             
-            assignment = await self.service.assign_ip(valid_ip_data)
+            assignment = self.service.assign_ip(valid_ip_data)
             assert assignment.ip_address == vlan.net_start
             assert assignment.ci_name == "TEST-DEVICE-001"
             
@@ -315,14 +315,14 @@ class LiveTestRunner:
             )
             
             try:
-                await self.service.assign_ip(reserved_ip_data)
+                self.service.assign_ip(reserved_ip_data)
                 assert False, "Should have prevented reserved IP assignment"
             except VLANConfigurationError:
                 pass  # Expected
             
             # Test duplicate IP prevention
             try:
-                await self.service.assign_ip(valid_ip_data)
+                self.service.assign_ip(valid_ip_data)
                 assert False, "Should have prevented duplicate IP assignment"
             except VLANConfigurationError:
                 pass  # Expected
@@ -364,7 +364,7 @@ class LiveTestRunner:
                         description="Test description",
                         is_active=True
                     )
-                    await self.service.create_domain(domain_data)
+                    self.service.create_domain(domain_data)
                     # If we get here, validation failed
                     assert False, f"Should have rejected invalid code: {invalid_code}"
                 except (VLANConfigurationError, ValueError):
@@ -10,6 +10,7 @@ from contextlib import asynccontextmanager
 from typing import Dict, Any
 
 from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
@@ -18,6 +19,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from ..models.exceptions import IPManagementError
 from ..config.database import engine, Base
+from ..core._ip_kernels import warm_up_kernels
 from .routers import domains, value_streams, zones, vlans, ip_assignments, reports
 
 # Configure logging
@@ -42,6 +44,9 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Database table creation warning (may already exist): {e}")
         # Continue anyway - tables might already exist
     
+    # Compile optional JIT kernels before the first request needs them
+    warm_up_kernels()
+    
     yield
     
     # Shutdown
@@ -99,7 +104,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={
             "error": "Validation Error",
             "message": "Invalid request data",
-            "details": exc.errors()
+            # ctx can hold the raised ValueError itself, which json cannot encode
+            "details": jsonable_encoder(exc.errors())
         }
     )
 
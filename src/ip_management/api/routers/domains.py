@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 
 from ...config.database import get_db
 from ...services.ip_service import IPManagementService
-from ...models.schemas import Domain, DomainCreate, DomainUpdate
+from ...models.schemas import Domain, DomainCreate, DomainSummary, DomainUpdate
 from ...models.exceptions import DomainNotFoundError, VLANConfigurationError
 
 router = APIRouter()
@@ -25,7 +25,7 @@ def get_ip_service(db: Session = Depends(get_db)) -> IPManagementService:
 
 
 @router.post("/domains", response_model=Domain, status_code=status.HTTP_201_CREATED)
-async def create_domain(
+def create_domain(
     domain_data: DomainCreate,
     service: IPManagementService = Depends(get_ip_service)
 ):
@@ -39,7 +39,7 @@ async def create_domain(
     - ENG: Engineering
     """
     try:
-        return await service.create_domain(domain_data)
+        return service.create_domain(domain_data)
     except VLANConfigurationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -48,22 +48,36 @@ async def create_domain(
 
 
 @router.get("/domains", response_model=List[Domain])
-async def list_domains(
+def list_domains(
     active_only: bool = True,
     service: IPManagementService = Depends(get_ip_service)
 ):
-    """List all domains with optional filtering by active status."""
-    return await service.list_domains(active_only=active_only)
+    """
+    List all domains with optional filtering by active status.
+    
+    Each domain includes its nested value streams, zones, VLANs and IP
+    assignments. Use ``/domains/summary`` when only the domain rows are needed.
+    """
+    return service.list_domains(active_only=active_only, with_hierarchy=True)
+
+
+@router.get("/domains/summary", response_model=List[DomainSummary])
+def list_domain_summaries(
+    active_only: bool = True,
+    service: IPManagementService = Depends(get_ip_service)
+):
+    """List domain rows only, without the nested hierarchy."""
+    return service.list_domains(active_only=active_only)
 
 
 @router.get("/domains/{domain_id}", response_model=Domain)
-async def get_domain(
+def get_domain(
     domain_id: UUID,
     service: IPManagementService = Depends(get_ip_service)
 ):
     """Get domain details by ID."""
     try:
-        return await service.get_domain(domain_id)
+        return service.get_domain(domain_id, with_hierarchy=True)
     except DomainNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -5,15 +5,20 @@ Handles device IP allocations with comprehensive validation
 and reserved IP protection.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ...config.database import get_db
+from ...config.database import get_db, get_async_db
 from ...services.ip_service import IPManagementService
-from ...models.schemas import IPAssignment, IPAssignmentCreate, IPAssignmentUpdate
+from ...services.bulk_import import BulkImportService
+from ...models.schemas import (
+    IPAssignment, IPAssignmentCreate, IPAssignmentUpdate, IP_ASSIGNMENT_LIST_ADAPTER
+)
 from ...models.exceptions import IPAllocationError, ReservedIPError
 
 router = APIRouter()
@@ -24,8 +29,13 @@ def get_ip_service(db: Session = Depends(get_db)) -> IPManagementService:
     return IPManagementService(db)
 
 
+def get_bulk_import_service(session: AsyncSession = Depends(get_async_db)) -> BulkImportService:
+    """Dependency to get the async bulk import service."""
+    return BulkImportService(session)
+
+
 @router.post("/ip-assignments", response_model=IPAssignment, status_code=status.HTTP_201_CREATED)
-async def assign_ip(
+def assign_ip(
     assignment_data: IPAssignmentCreate,
     service: IPManagementService = Depends(get_ip_service)
 ):
@@ -48,16 +58,74 @@ async def assign_ip(
     - description: Assignment description
     """
     try:
-        return await service.assign_ip(assignment_data)
+        return service.assign_ip(assignment_data)
+    except (IPAllocationError, ReservedIPError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post("/ip-assignments/bulk", response_model=List[IPAssignment], status_code=status.HTTP_201_CREATED)
+def assign_ips_bulk(
+    payload: List[Dict[str, Any]] = Body(...),
+    service: IPManagementService = Depends(get_ip_service)
+):
+    """
+    Assign multiple IP addresses in one request.
+    
+    The whole list is validated in one pass before any database work;
+    the batch is committed atomically or not at all.
+    """
+    try:
+        assignments = IP_ASSIGNMENT_LIST_ADAPTER.validate_python(payload)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False)
+        )
+    
+    try:
+        return service.assign_ips_bulk(assignments)
+    except (IPAllocationError, ReservedIPError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post("/ip-assignments/import", status_code=status.HTTP_201_CREATED)
+async def import_ip_assignments(
+    payload: List[Dict[str, Any]] = Body(...),
+    service: BulkImportService = Depends(get_bulk_import_service)
+):
+    """
+    Import a large list of IP assignments (e.g. a CMDB export).
+    
+    Runs on an async session and inserts in chunks of 1000 rows inside a
+    single transaction. Returns the number of imported assignments rather
+    than the created records.
+    """
+    try:
+        assignments = IP_ASSIGNMENT_LIST_ADAPTER.validate_python(payload)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False)
+        )
+    
+    try:
+        imported = await service.import_assignments(assignments)
     except (IPAllocationError, ReservedIPError) as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    return {"imported": imported}
 
 
 @router.get("/ip-assignments/{assignment_id}", response_model=IPAssignment)
-async def get_ip_assignment(
+def get_ip_assignment(
     assignment_id: UUID,
     service: IPManagementService = Depends(get_ip_service)
 ):
@@ -67,7 +135,7 @@ async def get_ip_assignment(
 
 
 @router.put("/ip-assignments/{assignment_id}", response_model=IPAssignment)
-async def update_ip_assignment(
+def update_ip_assignment(
     assignment_id: UUID,
     update_data: IPAssignmentUpdate,
     service: IPManagementService = Depends(get_ip_service)
@@ -78,7 +146,7 @@ async def update_ip_assignment(
 
 
 @router.delete("/ip-assignments/{assignment_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def release_ip_assignment(
+def release_ip_assignment(
     assignment_id: UUID,
     service: IPManagementService = Depends(get_ip_service)
 ):
@@ -89,7 +157,7 @@ async def release_ip_assignment(
     Does not delete the assignment record for audit purposes.
     """
     try:
-        success = await service.release_ip(assignment_id)
+        success = service.release_ip(assignment_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -103,7 +171,7 @@ async def release_ip_assignment(
 
 
 @router.get("/vlans/{vlan_id}/ip-assignments", response_model=List[IPAssignment])
-async def list_vlan_ip_assignments(
+def list_vlan_ip_assignments(
     vlan_id: UUID,
     active_only: bool = Query(True, description="Show only active assignments"),
     service: IPManagementService = Depends(get_ip_service)
@@ -23,7 +23,7 @@ def get_ip_service(db: Session = Depends(get_db)) -> IPManagementService:
 
 
 @router.get("/reports/network-hierarchy")
-async def get_network_hierarchy(
+def get_network_hierarchy(
     domain_id: Optional[UUID] = Query(None, description="Filter by specific domain"),
     service: IPManagementService = Depends(get_ip_service)
 ) -> Dict[str, Any]:
@@ -33,11 +33,12 @@ async def get_network_hierarchy(
     Returns the full Domain → Value Stream → Zone → VLAN → IP structure
     for network topology understanding and documentation.
     """
-    return await service.get_network_hierarchy(domain_id)
+    return service.get_network_hierarchy(domain_id)
 
 
 @router.get("/reports/security-compliance")
-async def get_security_compliance_report(
+def get_security_compliance_report(
+    detailed: bool = Query(False, description="Include per-zone firewall check details"),
     service: IPManagementService = Depends(get_ip_service)
 ) -> Dict[str, Any]:
     """
@@ -51,4 +52,4 @@ async def get_security_compliance_report(
     
     Critical for Bosch Rexroth IT/OT security audits.
     """
-    return await service.get_security_compliance_report()
\ No newline at end of file
+    return service.get_security_compliance_report(detailed)
\ No newline at end of file
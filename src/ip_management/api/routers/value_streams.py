@@ -25,7 +25,7 @@ def get_ip_service(db: Session = Depends(get_db)) -> IPManagementService:
 
 
 @router.post("/value-streams", response_model=ValueStream, status_code=status.HTTP_201_CREATED)
-async def create_value_stream(
+def create_value_stream(
     vs_data: ValueStreamCreate,
     service: IPManagementService = Depends(get_ip_service)
 ):
@@ -39,7 +39,7 @@ async def create_value_stream(
     - Engineering: Test Benches
     """
     try:
-        return await service.create_value_stream(vs_data)
+        return service.create_value_stream(vs_data)
     except VLANConfigurationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -48,13 +48,13 @@ async def create_value_stream(
 
 
 @router.get("/value-streams/{vs_id}", response_model=ValueStream)
-async def get_value_stream(
+def get_value_stream(
     vs_id: UUID,
     service: IPManagementService = Depends(get_ip_service)
 ):
     """Get value stream details by ID."""
     try:
-        return await service.get_value_stream(vs_id)
+        return service.get_value_stream(vs_id)
     except ValueStreamNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -5,16 +5,18 @@ Provides comprehensive VLAN configuration and IP calculation capabilities
 for industrial network segmentation.
 """
 
-from typing import List
+from typing import Any, Dict, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from ...config.database import get_db
 from ...services.ip_service import IPManagementService
 from ...models.schemas import (
-    VLAN, VLANCreate, VLANUpdate, VLANCalculationResult, IPAvailabilityResponse
+    VLAN, VLANCreate, VLANUpdate, VLANCalculationResult, IPAvailabilityResponse,
+    VLAN_CREATE_LIST_ADAPTER
 )
 from ...models.exceptions import VLANConfigurationError
 
@@ -27,7 +29,7 @@ def get_ip_service(db: Session = Depends(get_db)) -> IPManagementService:
 
 
 @router.get("/vlans", response_model=List[VLAN])
-async def list_vlans(
+def list_vlans(
     service: IPManagementService = Depends(get_ip_service)
 ):
     """
@@ -37,7 +39,7 @@ async def list_vlans(
     and current IP allocation status.
     """
     try:
-        return await service.list_vlans()
+        return service.list_vlans()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -46,7 +48,7 @@ async def list_vlans(
 
 
 @router.post("/vlans", response_model=VLAN, status_code=status.HTTP_201_CREATED)
-async def create_vlan(
+def create_vlan(
     vlan_data: VLANCreate,
     service: IPManagementService = Depends(get_ip_service)
 ):
@@ -63,7 +65,34 @@ async def create_vlan(
     - Last IP: Management use (non-assignable)
     """
     try:
-        return await service.create_vlan(vlan_data)
+        return service.create_vlan(vlan_data)
+    except VLANConfigurationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post("/vlans/bulk", response_model=List[VLAN], status_code=status.HTTP_201_CREATED)
+def create_vlans_bulk(
+    payload: List[Dict[str, Any]] = Body(...),
+    service: IPManagementService = Depends(get_ip_service)
+):
+    """
+    Create multiple VLANs in one request.
+    
+    The whole list is validated in one pass before any VLAN is created.
+    """
+    try:
+        vlans = VLAN_CREATE_LIST_ADAPTER.validate_python(payload)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False)
+        )
+    
+    try:
+        return service.create_vlans_bulk(vlans)
     except VLANConfigurationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -72,13 +101,13 @@ async def create_vlan(
 
 
 @router.get("/vlans/{vlan_id}", response_model=VLAN)
-async def get_vlan(
+def get_vlan(
     vlan_id: UUID,
     service: IPManagementService = Depends(get_ip_service)
 ):
     """Get VLAN details by ID."""
     try:
-        return await service.get_vlan(vlan_id)
+        return service.get_vlan(vlan_id)
     except VLANConfigurationError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -87,7 +116,7 @@ async def get_vlan(
 
 
 @router.post("/vlans/calculate", response_model=VLANCalculationResult)
-async def calculate_vlan_parameters(
+def calculate_vlan_parameters(
     vlan_id: int,
     subnet: str,
     netmask: str,
@@ -100,7 +129,7 @@ async def calculate_vlan_parameters(
     Returns all calculated network parameters including reserved IP ranges.
     """
     try:
-        return await service.calculate_vlan_parameters(vlan_id, subnet, netmask)
+        return service.calculate_vlan_parameters(vlan_id, subnet, netmask)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -109,7 +138,7 @@ async def calculate_vlan_parameters(
 
 
 @router.get("/vlans/{vlan_id}/availability", response_model=IPAvailabilityResponse)
-async def get_vlan_ip_availability(
+def get_vlan_ip_availability(
     vlan_id: UUID,
     service: IPManagementService = Depends(get_ip_service)
 ):
@@ -124,7 +153,7 @@ async def get_vlan_ip_availability(
     - Utilization percentage
     """
     try:
-        return await service.get_ip_availability(vlan_id)
+        return service.get_ip_availability(vlan_id)
     except VLANConfigurationError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -133,13 +162,13 @@ async def get_vlan_ip_availability(
 
 
 @router.get("/vlans/{vlan_id}/next-ip")
-async def get_next_available_ip(
+def get_next_available_ip(
     vlan_id: UUID,
     service: IPManagementService = Depends(get_ip_service)
 ):
     """Get the next available IP address in a VLAN."""
     try:
-        next_ip = await service.get_next_available_ip(vlan_id)
+        next_ip = service.get_next_available_ip(vlan_id)
         if next_ip:
             return {"next_available_ip": next_ip}
         else:
@@ -25,7 +25,7 @@ def get_ip_service(db: Session = Depends(get_db)) -> IPManagementService:
 
 
 @router.post("/zones", response_model=Zone, status_code=status.HTTP_201_CREATED)
-async def create_zone(
+def create_zone(
     zone_data: ZoneCreate,
     service: IPManagementService = Depends(get_ip_service)
 ):
@@ -42,7 +42,7 @@ async def create_zone(
     - RSZ_SL4: Restricted Zone
     """
     try:
-        return await service.create_zone(zone_data)
+        return service.create_zone(zone_data)
     except VLANConfigurationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -51,13 +51,13 @@ async def create_zone(
 
 
 @router.get("/zones/{zone_id}", response_model=Zone)
-async def get_zone(
+def get_zone(
     zone_id: UUID,
     service: IPManagementService = Depends(get_ip_service)
 ):
     """Get zone details by ID."""
     try:
-        return await service.get_zone(zone_id)
+        return service.get_zone(zone_id)
     except ZoneNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -66,7 +66,7 @@ async def get_zone(
 
 
 @router.patch("/zones/{zone_id}/firewall-check", response_model=Zone)
-async def update_firewall_check(
+def update_firewall_check(
     zone_id: UUID,
     service: IPManagementService = Depends(get_ip_service)
 ):
@@ -77,7 +77,7 @@ async def update_firewall_check(
     reviewed at least every 30 days per Bosch Rexroth security standards.
     """
     try:
-        return await service.update_firewall_check(zone_id)
+        return service.update_firewall_check(zone_id)
     except ZoneNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
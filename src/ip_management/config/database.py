@@ -6,13 +6,15 @@ transaction management, and environment-based configuration.
 """
 
 import os
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
 from ..models.database import Base
+from .strict_loading import enable_strict_loading
 
 # Database configuration from environment variables
 DATABASE_URL = os.getenv(
@@ -32,7 +34,13 @@ engine = create_engine(
 )
 
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Keep committed state loaded: create paths return objects without a refresh
+# SELECT; server defaults come back through INSERT ... RETURNING
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Development tripwire: raise on any relationship that was not eager-loaded
+if os.getenv("SQL_STRICT_LOADING", "false").lower() == "true":
+    enable_strict_loading(SessionLocal)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -48,6 +56,43 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# Async engine for bulk imports (asyncpg); created on first use
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+)
+
+_async_engine: Optional[AsyncEngine] = None
+_AsyncSessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Return the async session factory, creating the async engine lazily."""
+    global _async_engine, _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_size=10,
+            max_overflow=20,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            echo=os.getenv("SQL_DEBUG", "false").lower() == "true"
+        )
+        _AsyncSessionLocal = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _AsyncSessionLocal
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async database dependency for FastAPI.
+    
+    Used by bulk import endpoints so database round-trips do not block the
+    event loop.
+    """
+    async with get_async_sessionmaker()() as session:
+        yield session
+
+
 # Database event listeners for audit logging
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
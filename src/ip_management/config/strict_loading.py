@@ -0,0 +1,60 @@
+"""
+Strict relationship loading for test and development sessions.
+
+Appends ``raiseload("*")`` to every top-level ORM SELECT so that relationship
+access which was not explicitly eager-loaded fails loudly instead of silently
+issuing one lazy query per parent (N+1) during serialization.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, raiseload, sessionmaker
+
+_SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def _apply_raiseload(execute_state: ORMExecuteState) -> None:
+    """Add a wildcard raiseload to user-issued SELECT statements."""
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+    ):
+        # sql_only: many-to-one lookups satisfied from the identity map are fine
+        execute_state.statement = execute_state.statement.options(
+            raiseload("*", sql_only=True)
+        )
+
+
+def enable_strict_loading(session_factory: sessionmaker) -> None:
+    """Make all sessions created by ``session_factory`` raise on lazy loads."""
+    event.listen(session_factory, "do_orm_execute", _apply_raiseload)
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[List[str]]:
+    """
+    Record SQL statements executed on ``engine`` within the block.
+
+    SAVEPOINT bookkeeping (e.g. from sessions joined with
+    ``join_transaction_mode="create_savepoint"``) is not counted.
+
+    Usage:
+        with count_queries(engine) as statements:
+            ...
+        assert len(statements) <= 5
+    """
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(_SAVEPOINT_PREFIXES):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
@@ -0,0 +1,37 @@
+"""
+Optional Numba-compiled kernels for integer IP address scans.
+
+When Numba is not installed ``first_free_sorted`` is ``None`` and callers use
+their NumPy or pure Python paths instead. Kernels are compiled in-process at
+startup (``warm_up_kernels``) rather than cached on disk: Numba's cache records
+the importing package name, and this package is imported both as
+``ip_management`` and ``src.ip_management``.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Optional JIT accelerator
+    njit = None
+
+
+if njit is not None:
+    @njit
+    def first_free_sorted(start, end, assigned_sorted):
+        """Lowest integer in [start, end] absent from sorted ``assigned_sorted``, or -1."""
+        j = 0
+        n = assigned_sorted.size
+        for candidate in range(start, end + 1):
+            while j < n and assigned_sorted[j] < candidate:
+                j += 1
+            if j >= n or assigned_sorted[j] != candidate:
+                return candidate
+        return -1
+else:
+    first_free_sorted = None
+
+
+def warm_up_kernels() -> None:
+    """Trigger JIT compilation outside the request path."""
+    if first_free_sorted is not None:
+        first_free_sorted(0, 1, np.zeros(1, dtype=np.int64))
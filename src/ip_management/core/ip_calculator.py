@@ -6,10 +6,44 @@ according to Bosch Rexroth IT/OT network standards.
 """
 
 import ipaddress
-from typing import List, Tuple, Set
+import socket
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 
-from ..models.exceptions import InvalidSubnetError, InsufficientIPSpaceError
+from ..models.exceptions import InvalidSubnetError, InsufficientIPSpaceError, IPAllocationError
+from ._ip_kernels import first_free_sorted
+
+try:
+    import numpy as np
+except ImportError:  # Optional accelerator for bulk operations
+    np = None
+
+
+def ip_to_int(ip: str) -> int:
+    """Pack a dotted-quad IPv4 string into a 32-bit integer (raises OSError if malformed)."""
+    return struct.unpack("!I", socket.inet_aton(ip))[0]
+
+
+def int_to_ip(value: int) -> str:
+    """Format a 32-bit integer as a dotted-quad IPv4 string."""
+    return socket.inet_ntoa(struct.pack("!I", value))
+
+
+@lru_cache(maxsize=1024)
+def _parse_subnet(subnet: str, netmask: str) -> ipaddress.IPv4Network:
+    """Parse and memoize a subnet/netmask pair (CIDR or dotted decimal netmask)."""
+    # Handle both CIDR and dotted decimal netmask formats
+    if netmask.startswith('/'):
+        return ipaddress.IPv4Network(f"{subnet}{netmask}", strict=False)
+    
+    # Convert dotted decimal to CIDR
+    netmask_obj = ipaddress.IPv4Address(netmask)
+    prefix_len = sum(bin(int(octet)).count('1') for octet in str(netmask_obj).split('.'))
+    return ipaddress.IPv4Network(f"{subnet}/{prefix_len}", strict=False)
 
 
 @dataclass
@@ -29,16 +63,21 @@ class IPCalculator:
     - First 6 IPs reserved as management IPs
     - Last IP reserved as broadcast/management
     - Automatic subnet validation and IP generation
+    
+    The calculator holds no per-instance state; use the shared ``IP_CALC``
+    instance rather than constructing one per request.
     """
     
     RESERVED_START_COUNT = 6
     RESERVED_END_COUNT = 1
+    MIN_PREFIXLEN = 16  # Larger subnets are rejected rather than enumerated
     
-    def __init__(self) -> None:
-        self._reserved_ips: Set[ipaddress.IPv4Address] = set()
+    # Memoized by (subnet, netmask); shared with VLAN rows so each network is parsed once
+    parse_network = staticmethod(_parse_subnet)
     
+    @classmethod
     def calculate_subnet_info(
-        self, 
+        cls, 
         subnet: str, 
         netmask: str
     ) -> Tuple[ipaddress.IPv4Network, List[IPRange]]:
@@ -53,25 +92,30 @@ class IPCalculator:
             Tuple of (network object, list of IP ranges)
             
         Raises:
-            InvalidSubnetError: If subnet/netmask combination is invalid
+            InvalidSubnetError: If subnet/netmask combination is invalid, subnet
+                is not the network address, or the subnet is larger than
+                ``MIN_PREFIXLEN`` allows
             InsufficientIPSpaceError: If subnet too small for reserved IPs
         """
         try:
-            # Handle both CIDR and dotted decimal netmask formats
-            if netmask.startswith('/'):
-                network = ipaddress.IPv4Network(f"{subnet}{netmask}", strict=False)
-            else:
-                # Convert dotted decimal to CIDR
-                netmask_obj = ipaddress.IPv4Address(netmask)
-                prefix_len = sum(bin(int(octet)).count('1') for octet in str(netmask_obj).split('.'))
-                network = ipaddress.IPv4Network(f"{subnet}/{prefix_len}", strict=False)
-                
+            network = _parse_subnet(subnet, netmask)
         except (ipaddress.AddressValueError, ValueError) as e:
             raise InvalidSubnetError(f"Invalid subnet configuration: {e}") from e
         
+        # Parsing is non-strict; a host address would silently become its network
+        if str(network.network_address) != subnet:
+            raise InvalidSubnetError(
+                f"Subnet {subnet} is not the network address of {network}"
+            )
+        
+        if network.prefixlen < cls.MIN_PREFIXLEN:
+            raise InvalidSubnetError(
+                f"Subnet {network} too large. Prefix length must be at least /{cls.MIN_PREFIXLEN}"
+            )
+        
         # Validate minimum subnet size
         total_hosts = network.num_addresses - 2  # Exclude network and broadcast
-        required_reserved = self.RESERVED_START_COUNT + self.RESERVED_END_COUNT
+        required_reserved = cls.RESERVED_START_COUNT + cls.RESERVED_END_COUNT
         
         if total_hosts < required_reserved + 1:  # +1 for at least one assignable IP
             raise InsufficientIPSpaceError(
@@ -79,77 +123,223 @@ class IPCalculator:
                 f"but subnet only provides {total_hosts}"
             )
         
-        return network, self._generate_ip_ranges(network)
+        return network, cls._generate_ip_ranges(network)
+    
+    @staticmethod
+    def _host_bounds(network: ipaddress.IPv4Network) -> Tuple[int, int]:
+        """First and last host address of ``network`` as integers (same set as ``hosts()``)."""
+        first_host = int(network.network_address)
+        last_host = int(network.broadcast_address)
+        if network.prefixlen < 31:  # /31 and /32 have no network/broadcast address
+            first_host += 1
+            last_host -= 1
+        return first_host, last_host
     
-    def _generate_ip_ranges(self, network: ipaddress.IPv4Network) -> List[IPRange]:
+    @classmethod
+    def _generate_ip_ranges(cls, network: ipaddress.IPv4Network) -> List[IPRange]:
         """Generate IP ranges with reserved and assignable sections."""
-        hosts = list(network.hosts())
+        # Ranges are positional, so derive them from the host bounds instead of
+        # materializing network.hosts() (65k addresses for a /16)
+        first_host, last_host = cls._host_bounds(network)
+        host_count = last_host - first_host + 1
         ranges = []
         
         # Reserved management IPs (first 6)
-        if len(hosts) >= self.RESERVED_START_COUNT:
+        if host_count >= cls.RESERVED_START_COUNT:
             ranges.append(IPRange(
-                start_ip=hosts[0],
-                end_ip=hosts[self.RESERVED_START_COUNT - 1],
+                start_ip=ipaddress.IPv4Address(first_host),
+                end_ip=ipaddress.IPv4Address(first_host + cls.RESERVED_START_COUNT - 1),
                 is_reserved=True,
                 description="Management IPs (Reserved)"
             ))
         
         # Assignable IP range
-        assignable_start = self.RESERVED_START_COUNT
-        assignable_end = len(hosts) - self.RESERVED_END_COUNT - 1
+        assignable_start = first_host + cls.RESERVED_START_COUNT
+        assignable_end = last_host - cls.RESERVED_END_COUNT
         
         if assignable_start <= assignable_end:
             ranges.append(IPRange(
-                start_ip=hosts[assignable_start],
-                end_ip=hosts[assignable_end],
+                start_ip=ipaddress.IPv4Address(assignable_start),
+                end_ip=ipaddress.IPv4Address(assignable_end),
                 is_reserved=False,
                 description="Assignable IPs"
             ))
         
         # Reserved last IP
-        if len(hosts) >= self.RESERVED_END_COUNT:
+        if host_count >= cls.RESERVED_END_COUNT:
             ranges.append(IPRange(
-                start_ip=hosts[-1],
-                end_ip=hosts[-1],
+                start_ip=ipaddress.IPv4Address(last_host),
+                end_ip=ipaddress.IPv4Address(last_host),
                 is_reserved=True,
                 description="Management IP (Reserved)"
             ))
         
         return ranges
     
-    def get_default_gateway(self, network: ipaddress.IPv4Network) -> ipaddress.IPv4Address:
+    @classmethod
+    def get_default_gateway(cls, network: ipaddress.IPv4Network) -> ipaddress.IPv4Address:
         """Get the default gateway IP (typically first host address)."""
-        hosts = list(network.hosts())
-        return hosts[0] if hosts else network.network_address
+        first_host, _ = cls._host_bounds(network)
+        return ipaddress.IPv4Address(first_host)
     
-    def get_net_start_end(self, network: ipaddress.IPv4Network) -> Tuple[ipaddress.IPv4Address, ipaddress.IPv4Address]:
+    @classmethod
+    def get_net_start_end(cls, network: ipaddress.IPv4Network) -> Tuple[ipaddress.IPv4Address, ipaddress.IPv4Address]:
         """Get the assignable IP range start and end addresses."""
-        hosts = list(network.hosts())
-        if len(hosts) < self.RESERVED_START_COUNT + self.RESERVED_END_COUNT:
+        first_host, last_host = cls._host_bounds(network)
+        if last_host - first_host + 1 < cls.RESERVED_START_COUNT + cls.RESERVED_END_COUNT:
             raise InsufficientIPSpaceError("Insufficient IP space for assignable range")
         
-        start_ip = hosts[self.RESERVED_START_COUNT]
-        end_ip = hosts[-(self.RESERVED_END_COUNT + 1)]
+        start_ip = ipaddress.IPv4Address(first_host + cls.RESERVED_START_COUNT)
+        end_ip = ipaddress.IPv4Address(last_host - cls.RESERVED_END_COUNT)
         
         return start_ip, end_ip
     
-    def is_ip_assignable(self, ip: ipaddress.IPv4Address, network: ipaddress.IPv4Network) -> bool:
-        """Check if an IP address is assignable (not reserved)."""
-        if ip not in network:
+    @classmethod
+    def is_ip_assignable(
+        cls,
+        ip: Union[ipaddress.IPv4Address, int],
+        network: ipaddress.IPv4Network
+    ) -> bool:
+        """Check if an IP address (object or 32-bit integer) is assignable (not reserved)."""
+        ip_int = int(ip)
+        if ip_int & int(network.netmask) != int(network.network_address):
             return False
         
-        hosts = list(network.hosts())
-        ip_index = hosts.index(ip)
+        first_assignable, last_assignable = cls.assignable_bounds(network)
+        return first_assignable <= ip_int <= last_assignable
+    
+    @classmethod
+    def assignable_bounds(cls, network: ipaddress.IPv4Network) -> Tuple[int, int]:
+        """First and last assignable address of ``network`` as integers."""
+        # Reserved IPs are positional, so they are excluded by offsetting the host bounds
+        first_host, last_host = cls._host_bounds(network)
+        return first_host + cls.RESERVED_START_COUNT, last_host - cls.RESERVED_END_COUNT
+    
+    @classmethod
+    def first_unassignable(
+        cls,
+        ip_ints: Union["np.ndarray", Sequence[int]],
+        network: ipaddress.IPv4Network
+    ) -> Optional[int]:
+        """
+        Index of the first address outside the assignable range, or ``None``.
+        
+        Takes the integer addresses returned by ``validate_ip_batch`` (already
+        checked to be inside ``network``); NumPy input is checked with two
+        vectorized comparisons instead of a per-address loop.
+        """
+        first_assignable, last_assignable = cls.assignable_bounds(network)
         
-        # Check if IP is in reserved ranges
-        is_start_reserved = ip_index < self.RESERVED_START_COUNT
-        is_end_reserved = ip_index >= len(hosts) - self.RESERVED_END_COUNT
+        if np is not None and isinstance(ip_ints, np.ndarray):
+            outside = (ip_ints < first_assignable) | (ip_ints > last_assignable)
+            return int(outside.argmax()) if outside.any() else None
         
-        return not (is_start_reserved or is_end_reserved)
+        for index, ip_int in enumerate(ip_ints):
+            if not first_assignable <= ip_int <= last_assignable:
+                return index
+        return None
     
+    @staticmethod
+    def validate_ip_batch(
+        ips: Sequence[str],
+        network: ipaddress.IPv4Network
+    ) -> Union["np.ndarray", array]:
+        """
+        Validate a batch of IP addresses destined for a single network.
+        
+        Addresses are packed into 32-bit integers once, so subnet containment
+        and in-batch uniqueness are integer mask/compare operations rather than
+        per-address ipaddress objects. Uses NumPy when installed.
+        
+        Returns:
+            The addresses as uint32 values (NumPy array, or ``array('I')``)
+            
+        Raises:
+            IPAllocationError: If an address is malformed, outside the network,
+                or appears more than once in the batch
+        """
+        try:
+            packed = b"".join(socket.inet_aton(ip) for ip in ips)
+        except OSError as e:
+            raise IPAllocationError(f"Invalid IP address in batch: {e}") from e
+        
+        net_int = int(network.network_address)
+        mask_int = int(network.netmask)
+        
+        if np is not None:
+            ip_ints = np.frombuffer(packed, dtype=">u4").astype(np.uint32)
+            outside = (ip_ints & np.uint32(mask_int)) != np.uint32(net_int)
+            if outside.any():
+                raise IPAllocationError(
+                    f"IP {ips[int(outside.argmax())]} not in VLAN subnet {network}"
+                )
+            unique_ips, counts = np.unique(ip_ints, return_counts=True)
+            if unique_ips.size != ip_ints.size:
+                duplicate = ipaddress.IPv4Address(int(unique_ips[counts.argmax()]))
+                raise IPAllocationError(f"IP {duplicate} appears more than once in batch")
+            return ip_ints
+        
+        ip_ints = array("I", packed)
+        if sys.byteorder == "little":
+            ip_ints.byteswap()  # inet_aton yields network byte order
+        seen = set()
+        for ip, ip_int in zip(ips, ip_ints):
+            if ip_int & mask_int != net_int:
+                raise IPAllocationError(f"IP {ip} not in VLAN subnet {network}")
+            if ip_int in seen:
+                raise IPAllocationError(f"IP {ip} appears more than once in batch")
+            seen.add(ip_int)
+        return ip_ints
+    
+    @staticmethod
+    def first_free_address(
+        start: int,
+        end: int,
+        assigned_chunks: Iterable[Sequence[int]]
+    ) -> Optional[int]:
+        """
+        Find the lowest integer address in ``[start, end]`` that is not assigned.
+        
+        ``assigned_chunks`` must yield ascending, unique, in-range addresses
+        in pages (e.g. a streamed ``ORDER BY ip_address`` result). A page that
+        is one consecutive run starting at the current candidate is skipped in
+        O(1); the scan stops at the first page containing a gap, so later
+        pages are never fetched. Gaps inside a page are located with the Numba
+        kernel or NumPy when installed.
+        """
+        candidate = start
+        for chunk in assigned_chunks:
+            if not chunk:
+                continue
+            if chunk[0] != candidate:
+                break  # Gap right before this page
+            if chunk[-1] - chunk[0] == len(chunk) - 1:
+                candidate += len(chunk)  # Consecutive run, no gap inside
+                continue
+            candidate = IPCalculator._first_gap_in_run(candidate, chunk)
+            break
+        
+        return candidate if candidate <= end else None
+    
+    @staticmethod
+    def _first_gap_in_run(start: int, run: Sequence[int]) -> int:
+        """First integer >= ``start`` missing from sorted, unique ``run`` (run[0] == start)."""
+        if first_free_sorted is not None:
+            return int(first_free_sorted(start, start + len(run), np.asarray(run, dtype=np.int64)))
+        
+        if np is not None:
+            values = np.asarray(run, dtype=np.int64)
+            gaps = np.flatnonzero(values != np.arange(start, start + values.size))
+            return start + int(gaps[0])
+        
+        for offset, ip_int in enumerate(run):
+            if ip_int != start + offset:
+                return start + offset
+        return start + len(run)
+    
+    @classmethod
     def validate_vlan_configuration(
-        self, 
+        cls, 
         vlan_id: int, 
         subnet: str, 
         netmask: str
@@ -163,9 +353,10 @@ class IPCalculator:
         if not (1 <= vlan_id <= 4094):
             raise InvalidSubnetError("VLAN ID must be between 1 and 4094")
         
-        network, ip_ranges = self.calculate_subnet_info(subnet, netmask)
-        gateway = self.get_default_gateway(network)
-        net_start, net_end = self.get_net_start_end(network)
+        network, ip_ranges = cls.calculate_subnet_info(subnet, netmask)
+        gateway = cls.get_default_gateway(network)
+        net_start, net_end = cls.get_net_start_end(network)
+        first_assignable, last_assignable = cls.assignable_bounds(network)
         
         return {
             "vlan_id": vlan_id,
@@ -176,7 +367,7 @@ class IPCalculator:
             "net_start": str(net_start),
             "net_end": str(net_end),
             "total_ips": network.num_addresses - 2,
-            "assignable_ips": len([r for r in ip_ranges if not r.is_reserved]),
+            "assignable_ips": last_assignable - first_assignable + 1,
             "reserved_ranges": [
                 {
                     "start": str(r.start_ip),
@@ -185,4 +376,8 @@ class IPCalculator:
                 }
                 for r in ip_ranges if r.is_reserved
             ]
-        }
\ No newline at end of file
+        }
+
+
+# Shared stateless calculator instance
+IP_CALC = IPCalculator()
@@ -7,22 +7,74 @@ with proper relationships and constraints for industrial IT/OT environments.
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, Tuple
+import ipaddress
+import os
+import time
 import uuid
 
 from sqlalchemy import (
-    Column, String, Integer, DateTime, Boolean, Text, ForeignKey,
-    UniqueConstraint, CheckConstraint, Index
+    Column, String, Integer, BigInteger, DateTime, Boolean, Text, ForeignKey,
+    UniqueConstraint, CheckConstraint, Index, inspect
 )
-from sqlalchemy.dialects.postgresql import UUID, INET, MACADDR
+from sqlalchemy.dialects.postgresql import UUID, MACADDR, ENUM
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy.orm import relationship, Mapped, selectinload, load_only, LoaderCallableStatus
+from sqlalchemy.orm.interfaces import LoaderOption
 from sqlalchemy.sql import func
 
+from ..core.ip_calculator import IPCalculator, int_to_ip, ip_to_int
+
 
 Base = declarative_base()
 
 
+def _uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+    
+    Leading 48 bits are the Unix timestamp in milliseconds, so new primary
+    keys land at the right edge of the BTREE instead of random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                          # version
+        | ((rand >> 62) & 0xFFF) << 64       # rand_a
+        | 0b10 << 62                         # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+# Prefer the stdlib implementation where available (Python 3.14+)
+_uuid7 = getattr(uuid, "uuid7", _uuid7)
+
+
+class IPv4Integer(TypeDecorator):
+    """
+    IPv4 address stored as an unsigned 32-bit value in a BIGINT column.
+    
+    Python code keeps working with dotted-quad strings; values are packed on
+    bind and unpacked on load. Fixed-width integers keep rows and BTREE
+    indexes smaller than INET and make range predicates plain integer scans.
+    """
+    impl = BigInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        return ip_to_int(str(value))
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        return int_to_ip(value)
+
+
 class SecurityType(str, Enum):
     """Security zone types according to Bosch Rexroth standards."""
     SL3_SECURE_BCN = "SL3"
@@ -34,6 +86,34 @@ class SecurityType(str, Enum):
     RSZ_SL4 = "RSZ_SL4"  # Restricted Zone
 
 
+# Plain secondary indexes per table: (index name, *columns). ip_address has no
+# entry: lookups on it use the index behind the uq_ip_address constraint
+_INDEX_SPECS = {
+    "value_streams": (
+        ("ix_value_stream_domain_code", "domain_id", "code"),
+    ),
+    "zones": (
+        ("ix_zone_security_type", "security_type"),
+        ("ix_zone_value_stream", "value_stream_id"),
+    ),
+    "vlans": (
+        ("ix_vlan_zone", "zone_id"),
+        ("ix_vlan_subnet", "subnet"),
+    ),
+    "ip_assignments": (
+        ("ix_ci_name", "ci_name"),
+    ),
+}
+
+
+def _apply_indexes(cls):
+    """Class decorator attaching the table's indexes from ``_INDEX_SPECS`` once."""
+    table = cls.__table__
+    for name, *columns in _INDEX_SPECS.get(table.name, ()):
+        Index(name, *(table.c[column] for column in columns))
+    return cls
+
+
 class Domain(Base):
     """
     Top-level organizational unit (MFG, LOG, FCM, ENG).
@@ -42,7 +122,7 @@ class Domain(Base):
     """
     __tablename__ = "domains"
     
-    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
     code: Mapped[str] = Column(String(10), unique=True, nullable=False, index=True)
     name: Mapped[str] = Column(String(100), nullable=False)
     description: Mapped[Optional[str]] = Column(Text)
@@ -59,6 +139,7 @@ class Domain(Base):
         return f"<Domain(code='{self.code}', name='{self.name}')>"
 
 
+@_apply_indexes
 class ValueStream(Base):
     """
     Value streams within domains (A2, A4, A6, A10, MCO, LOG21, etc.).
@@ -67,7 +148,7 @@ class ValueStream(Base):
     """
     __tablename__ = "value_streams"
     
-    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
     domain_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("domains.id"), nullable=False)
     code: Mapped[str] = Column(String(20), nullable=False, index=True)
     name: Mapped[str] = Column(String(100), nullable=False)
@@ -85,13 +166,19 @@ class ValueStream(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint("domain_id", "code", name="uq_value_stream_domain_code"),
-        Index("ix_value_stream_domain_code", "domain_id", "code"),
     )
     
     def __repr__(self) -> str:
-        return f"<ValueStream(code='{self.code}', domain='{self.domain.code if self.domain else None}')>"
+        # Only use the parent if already loaded; logging must never emit a SELECT
+        domain = inspect(self).attrs.domain.loaded_value
+        if domain is LoaderCallableStatus.NO_VALUE:
+            domain_code = "<unloaded>"
+        else:
+            domain_code = domain.code if domain else None
+        return f"<ValueStream(code='{self.code}', domain='{domain_code}')>"
 
 
+@_apply_indexes
 class Zone(Base):
     """
     Security zones with specific security types and network segments.
@@ -100,10 +187,17 @@ class Zone(Base):
     """
     __tablename__ = "zones"
     
-    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
     value_stream_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("value_streams.id"), nullable=False)
     name: Mapped[str] = Column(String(100), nullable=False)
-    security_type: Mapped[SecurityType] = Column(String(20), nullable=False)
+    security_type: Mapped[SecurityType] = Column(
+        ENUM(
+            SecurityType,
+            name="security_type",
+            values_callable=lambda enum_cls: [member.value for member in enum_cls],
+        ),
+        nullable=False
+    )
     zone_manager: Mapped[Optional[str]] = Column(String(100))
     description: Mapped[Optional[str]] = Column(Text)
     last_firewall_check: Mapped[Optional[datetime]] = Column(DateTime(timezone=True))
@@ -117,20 +211,11 @@ class Zone(Base):
         "VLAN", back_populates="zone", cascade="all, delete-orphan"
     )
     
-    # Constraints
-    __table_args__ = (
-        CheckConstraint(
-            "security_type IN ('SL3', 'MFZ_SL4', 'LOG_SL4', 'FMZ_SL4', 'ENG_SL4', 'LRSZ_SL4', 'RSZ_SL4')",
-            name="ck_zone_security_type"
-        ),
-        Index("ix_zone_security_type", "security_type"),
-        Index("ix_zone_value_stream", "value_stream_id"),
-    )
-    
     def __repr__(self) -> str:
         return f"<Zone(name='{self.name}', security_type='{self.security_type}')>"
 
 
+@_apply_indexes
 class VLAN(Base):
     """
     VLAN configuration with network parameters and IP management.
@@ -139,14 +224,13 @@ class VLAN(Base):
     """
     __tablename__ = "vlans"
     
-    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
     zone_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("zones.id"), nullable=False)
     vlan_id: Mapped[int] = Column(Integer, nullable=False)
-    subnet: Mapped[str] = Column(INET, nullable=False)
+    subnet: Mapped[str] = Column(IPv4Integer, nullable=False)
     netmask: Mapped[str] = Column(String(15), nullable=False)  # e.g., "255.255.255.0"
-    default_gateway: Mapped[str] = Column(INET, nullable=False)
-    net_start: Mapped[str] = Column(INET, nullable=False)  # First assignable IP
-    net_end: Mapped[str] = Column(INET, nullable=False)    # Last assignable IP
+    # Last address of the subnet; with the subnet index, overlap checks are one range lookup
+    network_end: Mapped[str] = Column(IPv4Integer, nullable=False)
     description: Mapped[Optional[str]] = Column(Text)
     is_active: Mapped[bool] = Column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = Column(DateTime(timezone=True), server_default=func.now())
@@ -162,14 +246,44 @@ class VLAN(Base):
     __table_args__ = (
         UniqueConstraint("vlan_id", name="uq_vlan_id"),
         CheckConstraint("vlan_id >= 1 AND vlan_id <= 4094", name="ck_vlan_id_range"),
-        Index("ix_vlan_zone", "zone_id"),
-        Index("ix_vlan_subnet", "subnet"),
     )
     
+    # Derived network parameters; computed from subnet/netmask rather than stored
+    @property
+    def network(self) -> ipaddress.IPv4Network:
+        """Network object for subnet/netmask (netmask may be CIDR or dotted)."""
+        return IPCalculator.parse_network(self.subnet, self.netmask)
+    
+    @property
+    def default_gateway(self) -> str:
+        """Default gateway (first host address)."""
+        return str(self.network.network_address + 1)
+    
+    @property
+    def net_start(self) -> str:
+        """First assignable IP (after the reserved management range)."""
+        return str(self.network.network_address + 1 + IPCalculator.RESERVED_START_COUNT)
+    
+    @property
+    def net_end(self) -> str:
+        """Last assignable IP (before the reserved trailing address)."""
+        return str(self.network.broadcast_address - 1 - IPCalculator.RESERVED_END_COUNT)
+    
+    @property
+    def total_ips(self) -> int:
+        """Host addresses in the subnet (excluding network and broadcast)."""
+        return self.network.num_addresses - 2
+    
+    @property
+    def assignable_ips(self) -> int:
+        """Host addresses outside the reserved management ranges."""
+        return self.total_ips - IPCalculator.RESERVED_START_COUNT - IPCalculator.RESERVED_END_COUNT
+    
     def __repr__(self) -> str:
         return f"<VLAN(id={self.vlan_id}, subnet='{self.subnet}')>"
 
 
+@_apply_indexes
 class IPAssignment(Base):
     """
     Individual IP address assignments to devices.
@@ -178,10 +292,11 @@ class IPAssignment(Base):
     """
     __tablename__ = "ip_assignments"
     
-    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), primary_key=True, default=_uuid7)
     vlan_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("vlans.id"), nullable=False)
-    ip_address: Mapped[str] = Column(INET, nullable=False)
-    mac_address: Mapped[Optional[str]] = Column(MACADDR)
+    ip_address: Mapped[str] = Column(IPv4Integer, nullable=False)
+    # MACADDR has no SQLite type; the in-memory test database stores the text form
+    mac_address: Mapped[Optional[str]] = Column(MACADDR().with_variant(String(17), "sqlite"))
     ci_name: Mapped[str] = Column(String(100), nullable=False)  # Configuration Item Name
     description: Mapped[Optional[str]] = Column(Text)
     is_reserved: Mapped[bool] = Column(Boolean, default=False, nullable=False)
@@ -198,15 +313,54 @@ class IPAssignment(Base):
     __table_args__ = (
         UniqueConstraint("ip_address", name="uq_ip_address"),
         UniqueConstraint("mac_address", name="uq_mac_address"),
-        Index("ix_ip_vlan", "vlan_id"),
-        Index("ix_ip_address", "ip_address"),
-        Index("ix_ci_name", "ci_name"),
+        CheckConstraint("ip_address BETWEEN 0 AND 4294967295", name="ck_ip_address_ipv4"),
+        # Covers per-VLAN availability counts as an index-only scan and returns a
+        # VLAN's active addresses already ordered for the next-free-IP gap scan;
+        # ip_address uniqueness and MAC lookups use the unique constraints above
+        Index(
+            "ix_ip_vlan_active_addr", "vlan_id", "is_active", "ip_address",
+            postgresql_include=["is_reserved"]
+        ),
     )
     
     def __repr__(self) -> str:
         return f"<IPAssignment(ip='{self.ip_address}', ci_name='{self.ci_name}')>"
 
 
+def domain_full_loader_options() -> Tuple[LoaderOption, ...]:
+    """
+    Loader options for serializing a Domain with its complete hierarchy.
+    
+    Relationships stay lazy by default; queries feeding the nested Domain
+    response opt in with ``query(Domain).options(*domain_full_loader_options())``
+    so each level is fetched with a single ``WHERE parent_id IN (...)`` SELECT.
+    """
+    return (
+        selectinload(Domain.value_streams)
+        .selectinload(ValueStream.zones)
+        .selectinload(Zone.vlans)
+        .selectinload(VLAN.ip_assignments),
+    )
+
+
+def hierarchy_report_loader_options() -> Tuple[LoaderOption, ...]:
+    """
+    Column options for the network hierarchy report (Domain -> VLAN).
+    
+    The report selects all four levels in one joined query; these options
+    restrict each entity to the columns the report shows, so descriptions,
+    timestamps and firewall-check dates are never fetched.
+    """
+    return (
+        load_only(Domain.code, Domain.name, Domain.is_active),
+        load_only(ValueStream.domain_id, ValueStream.code, ValueStream.name, ValueStream.is_active),
+        load_only(
+            Zone.value_stream_id, Zone.name, Zone.security_type, Zone.zone_manager, Zone.is_active
+        ),
+        load_only(VLAN.zone_id, VLAN.vlan_id, VLAN.subnet, VLAN.netmask, VLAN.is_active),
+    )
+
+
 # Database triggers and functions would be added here for:
 # 1. Preventing assignment of reserved IPs
 # 2. Automatic IP validation against VLAN subnet
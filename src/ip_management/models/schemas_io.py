@@ -0,0 +1,266 @@
+"""
+Flat Pydantic schemas for API input and simple responses.
+
+Holds the ``*Base``/``*Create``/``*Update`` schemas and flat result models.
+Nothing here references nested relationships, so importing this module never
+triggers ``model_rebuild()``.
+"""
+
+from datetime import datetime
+from typing import Optional, List
+from uuid import UUID
+from socket import inet_aton, inet_ntoa
+
+from pydantic import BaseModel, Field, validator, ConfigDict, TypeAdapter
+from .database import SecurityType
+
+
+# Separators stripped before parsing MAC addresses
+_MAC_SEPARATORS = str.maketrans("", "", ":-.")
+
+# Value -> member lookup; resolves security types without the Enum coercion path
+_SECURITY_TYPES = {st.value: st for st in SecurityType}
+
+
+def _is_dotted_ipv4(v: str) -> bool:
+    """
+    Check strict dotted-quad IPv4 format using the C-level socket parser.
+    
+    The round trip rejects forms ``inet_aton`` tolerates but we do not
+    store, such as "10.1", hex octets or leading zeros.
+    """
+    try:
+        return inet_ntoa(inet_aton(v)) == v
+    except (OSError, ValueError):
+        return False
+
+
+def _coerce_security_type(v):
+    """Map a security type value to its enum member with a single dict lookup."""
+    if v is None or isinstance(v, SecurityType):
+        return v
+    try:
+        return _SECURITY_TYPES[v]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid security type: {v}") from None
+
+
+# Base schemas with common fields
+class BaseSchema(BaseModel):
+    """Base schema with common configuration."""
+    # Build validators at class creation (not on first request); no assignment validation
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=False,
+        validate_assignment=False,
+        arbitrary_types_allowed=False
+    )
+
+
+class TimestampMixin(BaseModel):
+    """Mixin for timestamp fields."""
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+# Domain schemas
+class DomainBase(BaseSchema):
+    """Base domain schema."""
+    code: str = Field(..., min_length=1, max_length=10, description="Domain code (e.g., MFG, LOG)")
+    name: str = Field(..., min_length=1, max_length=100, description="Domain name")
+    description: Optional[str] = Field(None, description="Domain description")
+    is_active: bool = Field(True, description="Whether domain is active")
+
+
+class DomainCreate(DomainBase):
+    """Schema for creating a domain."""
+    pass
+
+
+class DomainSummary(DomainBase, TimestampMixin):
+    """Domain row without its hierarchy (shallow listings)."""
+    id: UUID
+
+
+class DomainUpdate(BaseSchema):
+    """Schema for updating a domain."""
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    description: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+# Value Stream schemas
+class ValueStreamBase(BaseSchema):
+    """Base value stream schema."""
+    code: str = Field(..., min_length=1, max_length=20, description="Value stream code")
+    name: str = Field(..., min_length=1, max_length=100, description="Value stream name")
+    description: Optional[str] = Field(None, description="Value stream description")
+    is_active: bool = Field(True, description="Whether value stream is active")
+
+
+class ValueStreamCreate(ValueStreamBase):
+    """Schema for creating a value stream."""
+    domain_id: UUID = Field(..., description="Parent domain ID")
+
+
+class ValueStreamUpdate(BaseSchema):
+    """Schema for updating a value stream."""
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    description: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+# Zone schemas
+class ZoneBase(BaseSchema):
+    """Base zone schema."""
+    name: str = Field(..., min_length=1, max_length=100, description="Zone name")
+    security_type: SecurityType = Field(..., description="Security classification")
+    zone_manager: Optional[str] = Field(None, max_length=100, description="Zone manager name")
+    description: Optional[str] = Field(None, description="Zone description")
+    last_firewall_check: Optional[datetime] = Field(None, description="Last firewall rule check")
+    is_active: bool = Field(True, description="Whether zone is active")
+    
+    _validate_security_type = validator('security_type', pre=True, allow_reuse=True)(_coerce_security_type)
+
+
+class ZoneCreate(ZoneBase):
+    """Schema for creating a zone."""
+    value_stream_id: UUID = Field(..., description="Parent value stream ID")
+
+
+class ZoneUpdate(BaseSchema):
+    """Schema for updating a zone."""
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    security_type: Optional[SecurityType] = None
+    zone_manager: Optional[str] = Field(None, max_length=100)
+    description: Optional[str] = None
+    last_firewall_check: Optional[datetime] = None
+    is_active: Optional[bool] = None
+    
+    _validate_security_type = validator('security_type', pre=True, allow_reuse=True)(_coerce_security_type)
+
+
+# VLAN schemas
+class VLANBase(BaseSchema):
+    """Base VLAN schema."""
+    vlan_id: int = Field(..., ge=1, le=4094, description="VLAN ID (1-4094)")
+    subnet: str = Field(..., description="Network subnet (e.g., 192.168.1.0)")
+    netmask: str = Field(..., description="Subnet mask (e.g., 255.255.255.0)")
+    description: Optional[str] = Field(None, description="VLAN description")
+    is_active: bool = Field(True, description="Whether VLAN is active")
+    
+    @validator('subnet')
+    def validate_subnet(cls, v):
+        """Validate subnet format."""
+        if not _is_dotted_ipv4(v):
+            raise ValueError('Invalid subnet address format')
+        return v
+    
+    @validator('netmask')
+    def validate_netmask(cls, v):
+        """Validate netmask format."""
+        if v.startswith('/'):
+            # CIDR notation
+            try:
+                prefix = int(v[1:])
+                if not 0 <= prefix <= 32:
+                    raise ValueError('CIDR prefix must be between 0 and 32')
+                return v
+            except ValueError:
+                raise ValueError('Invalid CIDR notation') from None
+        else:
+            # Dotted decimal notation
+            if not _is_dotted_ipv4(v):
+                raise ValueError('Invalid netmask format')
+            return v
+
+
+class VLANCreate(VLANBase):
+    """Schema for creating a VLAN."""
+    zone_id: UUID = Field(..., description="Parent zone ID")
+
+
+class VLANUpdate(BaseSchema):
+    """Schema for updating a VLAN."""
+    description: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+# IP Assignment schemas
+class IPAssignmentBase(BaseSchema):
+    """Base IP assignment schema."""
+    ip_address: str = Field(..., description="Assigned IP address")
+    mac_address: Optional[str] = Field(None, description="Device MAC address")
+    ci_name: str = Field(..., min_length=1, max_length=100, description="Configuration Item name")
+    description: Optional[str] = Field(None, description="Assignment description")
+    is_active: bool = Field(True, description="Whether assignment is active")
+    
+    @validator('ip_address')
+    def validate_ip_address(cls, v):
+        """Validate IP address format."""
+        if not _is_dotted_ipv4(v):
+            raise ValueError('Invalid IP address format')
+        return v
+    
+    @validator('mac_address')
+    def validate_mac_address(cls, v):
+        """Validate MAC address format."""
+        if v is None:
+            return v
+        
+        # Accept ':', '-' or '.' separated (or bare) hex; parsing is done in C
+        mac_clean = v.translate(_MAC_SEPARATORS)
+        try:
+            if len(mac_clean) != 12:
+                raise ValueError
+            mac_bytes = bytes.fromhex(mac_clean)
+            if len(mac_bytes) != 6:  # fromhex skips whitespace between byte pairs
+                raise ValueError
+        except ValueError:
+            raise ValueError('Invalid MAC address format') from None
+        
+        # Return in standard format
+        return mac_bytes.hex(':').upper()
+
+
+class IPAssignmentCreate(IPAssignmentBase):
+    """Schema for creating an IP assignment."""
+    vlan_id: UUID = Field(..., description="Parent VLAN ID")
+
+
+class IPAssignmentUpdate(BaseSchema):
+    """Schema for updating an IP assignment."""
+    mac_address: Optional[str] = None
+    ci_name: Optional[str] = Field(None, min_length=1, max_length=100)
+    description: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+# Response schemas for complex operations
+class VLANCalculationResult(BaseSchema):
+    """Result of VLAN subnet calculation."""
+    vlan_id: int
+    network: str
+    subnet: str
+    netmask: str
+    default_gateway: str
+    net_start: str
+    net_end: str
+    total_ips: int
+    assignable_ips: int
+    reserved_ranges: List[dict]
+
+
+class IPAvailabilityResponse(BaseSchema):
+    """IP availability information for a VLAN."""
+    vlan_id: UUID
+    total_ips: int
+    assigned_ips: int
+    available_ips: int
+    reserved_ips: int
+    utilization_percentage: float
+
+
+# Batch adapters: compile list validation once instead of per-item model_validate
+IP_ASSIGNMENT_LIST_ADAPTER = TypeAdapter(List[IPAssignmentCreate])
+VLAN_CREATE_LIST_ADAPTER = TypeAdapter(List[VLANCreate])
@@ -0,0 +1,73 @@
+"""
+Nested Pydantic response schemas.
+
+Response models that embed child collections (Domain -> ValueStream -> Zone ->
+VLAN -> IPAssignment). Their forward references are resolved here, so the
+rebuild cost is only paid by modules that serialize full hierarchies.
+"""
+
+from datetime import datetime
+from typing import Optional, List
+from uuid import UUID
+
+from pydantic import Field
+
+from .schemas_io import (
+    BaseSchema, TimestampMixin, DomainBase, ValueStreamBase, ZoneBase,
+    VLANBase, IPAssignmentBase
+)
+
+
+class Domain(DomainBase, TimestampMixin):
+    """Complete domain schema with relationships."""
+    id: UUID
+    value_streams: List["ValueStream"] = Field(default_factory=list)
+
+
+class ValueStream(ValueStreamBase, TimestampMixin):
+    """Complete value stream schema with relationships."""
+    id: UUID
+    domain_id: UUID
+    zones: List["Zone"] = Field(default_factory=list)
+
+
+class Zone(ZoneBase, TimestampMixin):
+    """Complete zone schema with relationships."""
+    id: UUID
+    value_stream_id: UUID
+    vlans: List["VLAN"] = Field(default_factory=list)
+
+
+class VLAN(VLANBase, TimestampMixin):
+    """Complete VLAN schema with calculated fields."""
+    id: UUID
+    zone_id: UUID
+    default_gateway: str = Field(..., description="Default gateway IP")
+    net_start: str = Field(..., description="First assignable IP")
+    net_end: str = Field(..., description="Last assignable IP")
+    ip_assignments: List["IPAssignment"] = Field(default_factory=list)
+
+
+class IPAssignment(IPAssignmentBase, TimestampMixin):
+    """Complete IP assignment schema."""
+    id: UUID
+    vlan_id: UUID
+    is_reserved: bool = Field(..., description="Whether IP is reserved")
+    assigned_at: datetime = Field(..., description="Assignment timestamp")
+    last_seen: Optional[datetime] = Field(None, description="Last seen timestamp")
+
+
+class NetworkHierarchyResponse(BaseSchema):
+    """Complete network hierarchy response."""
+    domain: Domain
+    value_streams: List[ValueStream]
+    zones: List[Zone]
+    vlans: List[VLAN]
+
+
+# Update forward references
+Domain.model_rebuild()
+ValueStream.model_rebuild()
+Zone.model_rebuild()
+VLAN.model_rebuild()
+IPAssignment.model_rebuild()
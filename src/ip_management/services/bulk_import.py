@@ -0,0 +1,86 @@
+"""
+Bulk IP assignment import on an async session.
+
+Large imports (e.g. a full /24 from a CMDB export) are validated in memory
+against their VLANs and written in multi-row INSERT chunks over an
+``AsyncSession``, so the event loop keeps serving other requests while the
+rows are sent to PostgreSQL.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, List
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.ip_calculator import IP_CALC
+from ..models.database import VLAN, IPAssignment
+from ..models.exceptions import IPAllocationError, ReservedIPError
+from ..models.schemas_io import IPAssignmentCreate
+
+logger = logging.getLogger(__name__)
+
+
+class BulkImportService:
+    """Validates and inserts large batches of IP assignments."""
+    
+    CHUNK_SIZE = 1000
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def import_assignments(self, assignments: List[IPAssignmentCreate]) -> int:
+        """
+        Import IP assignments in one transaction.
+        
+        Validates:
+        - Every target VLAN exists
+        - IPs are within their VLAN subnet and unique within the batch
+        - IPs are not reserved (first 6 + last)
+        
+        Conflicts with existing assignments are caught by the unique
+        constraints; the whole import is rolled back in that case.
+        
+        Returns:
+            Number of imported assignments
+        """
+        if not assignments:
+            return 0
+        
+        by_vlan: Dict = defaultdict(list)
+        for assignment_data in assignments:
+            by_vlan[assignment_data.vlan_id].append(assignment_data.ip_address)
+        rows = [assignment_data.model_dump() for assignment_data in assignments]
+        
+        try:
+            async with self.session.begin():
+                result = await self.session.execute(select(VLAN).where(VLAN.id.in_(by_vlan)))
+                vlans = {vlan.id: vlan for vlan in result.scalars()}
+                self._validate_batches(by_vlan, vlans)
+                
+                for start in range(0, len(rows), self.CHUNK_SIZE):
+                    await self.session.execute(
+                        insert(IPAssignment), rows[start:start + self.CHUNK_SIZE]
+                    )
+        except IntegrityError as e:
+            raise IPAllocationError(f"Import conflicts with existing assignments: {e.orig}") from e
+        
+        logger.info(f"Imported {len(rows)} IP assignments")
+        return len(rows)
+    
+    @staticmethod
+    def _validate_batches(by_vlan: Dict, vlans: Dict) -> None:
+        """Check subnet membership, in-batch uniqueness and reserved ranges per VLAN."""
+        for vlan_id, ips in by_vlan.items():
+            vlan = vlans.get(vlan_id)
+            if vlan is None:
+                raise IPAllocationError(f"VLAN {vlan_id} not found")
+            
+            network = vlan.network
+            ip_ints = IP_CALC.validate_ip_batch(ips, network)
+            reserved = IP_CALC.first_unassignable(ip_ints, network)
+            if reserved is not None:
+                raise ReservedIPError(f"IP {ips[reserved]} is reserved and cannot be assigned")
+
@@ -5,29 +5,55 @@ Orchestrates IP allocation, VLAN management, and network operations
 with comprehensive validation and audit logging.
 """
 
-import ipaddress
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 import logging
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_, or_
+from sqlalchemy import BigInteger, and_, case, or_, func, insert, select, type_coerce
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from ..models.database import Domain, ValueStream, Zone, VLAN, IPAssignment, SecurityType
+from ..models.database import (
+    Domain, ValueStream, Zone, VLAN, IPAssignment, SecurityType,
+    domain_full_loader_options, hierarchy_report_loader_options
+)
 from ..models.exceptions import (
     IPAllocationError, ReservedIPError, VLANConfigurationError,
     DomainNotFoundError, ZoneNotFoundError, ValueStreamNotFoundError
 )
-from ..core.ip_calculator import IPCalculator
-from ..models.schemas import (
+from ..core.ip_calculator import IP_CALC, int_to_ip, ip_to_int
+from ..models.schemas_io import (
     DomainCreate, ValueStreamCreate, ZoneCreate, VLANCreate, IPAssignmentCreate,
     VLANCalculationResult, IPAvailabilityResponse
 )
 
 logger = logging.getLogger(__name__)
 
+# SecurityType is a str enum, so members hash and compare equal to their values
+_SECURITY_TYPE_VALUES = frozenset(SecurityType)
+
+# How a uq_mac_address violation is reported: constraint name (PostgreSQL) or column (SQLite)
+_MAC_CONFLICT_MARKERS = ("uq_mac_address", "ip_assignments.mac_address")
+
+# INSERT ... ON CONFLICT constructs per dialect; both support DO NOTHING ... RETURNING
+_DIALECT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+def _violated_constraint(error: IntegrityError) -> str:
+    """Constraint name behind an IntegrityError, or the driver message if it has none."""
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None and diag.constraint_name:
+        return diag.constraint_name
+    return str(error.orig)
+
+
+def _report_fields(row, *fields: str) -> Dict[str, Any]:
+    """Plain dict of a report row's loaded columns, so reports serialize as JSON."""
+    return {field: getattr(row, field) for field in fields}
+
 
 class IPManagementService:
     """
@@ -39,16 +65,19 @@ class IPManagementService:
     
     def __init__(self, db: Session):
         self.db = db
-        self.ip_calculator = IPCalculator()
+        self.ip_calculator = IP_CALC
+    
+    def _parent_exists(self, model, parent_id: UUID) -> bool:
+        """Check a parent row exists with EXISTS, without loading it."""
+        return self.db.query(self.db.query(model).filter(model.id == parent_id).exists()).scalar()
     
     # Domain Management
-    async def create_domain(self, domain_data: DomainCreate) -> Domain:
+    def create_domain(self, domain_data: DomainCreate) -> Domain:
         """Create a new domain with validation."""
         try:
             domain = Domain(**domain_data.model_dump())
             self.db.add(domain)
             self.db.commit()
-            self.db.refresh(domain)
             
             logger.info(f"Created domain: {domain.code}")
             return domain
@@ -57,33 +86,38 @@ class IPManagementService:
             self.db.rollback()
             raise VLANConfigurationError(f"Domain code '{domain_data.code}' already exists") from e
     
-    async def get_domain(self, domain_id: UUID) -> Domain:
-        """Get domain by ID."""
-        domain = self.db.query(Domain).filter(Domain.id == domain_id).first()
+    def get_domain(self, domain_id: UUID, with_hierarchy: bool = False) -> Domain:
+        """Get domain by ID, optionally eager-loading its full hierarchy."""
+        query = self.db.query(Domain)
+        if with_hierarchy:
+            query = query.options(*domain_full_loader_options())
+        domain = query.filter(Domain.id == domain_id).first()
         if not domain:
             raise DomainNotFoundError(f"Domain {domain_id} not found")
         return domain
     
-    async def list_domains(self, active_only: bool = True) -> List[Domain]:
-        """List all domains."""
+    def list_domains(self, active_only: bool = True, with_hierarchy: bool = False) -> List[Domain]:
+        """List domains, optionally eager-loading their full hierarchy."""
         query = self.db.query(Domain)
+        if with_hierarchy:
+            query = query.options(*domain_full_loader_options())
         if active_only:
             query = query.filter(Domain.is_active == True)
         return query.all()
     
     # Value Stream Management
-    async def create_value_stream(self, vs_data: ValueStreamCreate) -> ValueStream:
+    def create_value_stream(self, vs_data: ValueStreamCreate) -> ValueStream:
         """Create a new value stream."""
         # Validate parent domain exists
-        domain = await self.get_domain(vs_data.domain_id)
+        if not self._parent_exists(Domain, vs_data.domain_id):
+            raise DomainNotFoundError(f"Domain {vs_data.domain_id} not found")
         
         try:
             value_stream = ValueStream(**vs_data.model_dump())
             self.db.add(value_stream)
             self.db.commit()
-            self.db.refresh(value_stream)
             
-            logger.info(f"Created value stream: {value_stream.code} in domain {domain.code}")
+            logger.info(f"Created value stream: {value_stream.code} in domain {vs_data.domain_id}")
             return value_stream
             
         except IntegrityError as e:
@@ -92,7 +126,7 @@ class IPManagementService:
                 f"Value stream code '{vs_data.code}' already exists in domain"
             ) from e
     
-    async def get_value_stream(self, vs_id: UUID) -> ValueStream:
+    def get_value_stream(self, vs_id: UUID) -> ValueStream:
         """Get value stream by ID."""
         vs = self.db.query(ValueStream).filter(ValueStream.id == vs_id).first()
         if not vs:
@@ -100,33 +134,33 @@ class IPManagementService:
         return vs
     
     # Zone Management
-    async def create_zone(self, zone_data: ZoneCreate) -> Zone:
+    def create_zone(self, zone_data: ZoneCreate) -> Zone:
         """Create a new zone with security validation."""
         # Validate parent value stream exists
-        vs = await self.get_value_stream(zone_data.value_stream_id)
+        if not self._parent_exists(ValueStream, zone_data.value_stream_id):
+            raise ValueStreamNotFoundError(f"Value stream {zone_data.value_stream_id} not found")
         
         # Validate security type
-        if zone_data.security_type not in SecurityType:
+        if zone_data.security_type not in _SECURITY_TYPE_VALUES:
             raise VLANConfigurationError(f"Invalid security type: {zone_data.security_type}")
         
         zone = Zone(**zone_data.model_dump())
         self.db.add(zone)
         self.db.commit()
-        self.db.refresh(zone)
         
         logger.info(f"Created zone: {zone.name} with security type {zone.security_type}")
         return zone
     
-    async def get_zone(self, zone_id: UUID) -> Zone:
+    def get_zone(self, zone_id: UUID) -> Zone:
         """Get zone by ID."""
         zone = self.db.query(Zone).filter(Zone.id == zone_id).first()
         if not zone:
             raise ZoneNotFoundError(f"Zone {zone_id} not found")
         return zone
     
-    async def update_firewall_check(self, zone_id: UUID) -> Zone:
+    def update_firewall_check(self, zone_id: UUID) -> Zone:
         """Update last firewall rule check timestamp."""
-        zone = await self.get_zone(zone_id)
+        zone = self.get_zone(zone_id)
         zone.last_firewall_check = datetime.utcnow()
         self.db.commit()
         self.db.refresh(zone)
@@ -135,7 +169,7 @@ class IPManagementService:
         return zone
     
     # VLAN Management
-    async def create_vlan(self, vlan_data: VLANCreate) -> VLAN:
+    def create_vlan(self, vlan_data: VLANCreate) -> VLAN:
         """
         Create a new VLAN with automatic IP calculation.
         
@@ -145,16 +179,32 @@ class IPManagementService:
         - VLAN ID uniqueness validation
         """
         # Validate parent zone exists
-        zone = await self.get_zone(vlan_data.zone_id)
+        if not self._parent_exists(Zone, vlan_data.zone_id):
+            raise ZoneNotFoundError(f"Zone {vlan_data.zone_id} not found")
         
+        return self._create_vlan(vlan_data)
+    
+    def create_vlans_bulk(self, vlans: List[VLANCreate]) -> List[VLAN]:
+        """Create several VLANs, stopping at the first configuration error."""
+        # Resolve all parent zones with one IN query instead of one lookup per VLAN
+        zone_ids = {vlan_data.zone_id for vlan_data in vlans}
+        found = {zone_id for (zone_id,) in self.db.query(Zone.id).filter(Zone.id.in_(zone_ids))}
+        for vlan_data in vlans:
+            if vlan_data.zone_id not in found:
+                raise ZoneNotFoundError(f"Zone {vlan_data.zone_id} not found")
+        
+        return [self._create_vlan(vlan_data) for vlan_data in vlans]
+    
+    def _create_vlan(self, vlan_data: VLANCreate) -> VLAN:
+        """Validate and insert a VLAN whose parent zone is known to exist."""
         # Check VLAN ID uniqueness
         existing_vlan = self.db.query(VLAN).filter(VLAN.vlan_id == vlan_data.vlan_id).first()
         if existing_vlan:
             raise VLANConfigurationError(f"VLAN ID {vlan_data.vlan_id} already exists")
         
-        # Calculate network parameters
+        # Validate network parameters (gateway and range are derived on the model)
         try:
-            calc_result = self.ip_calculator.validate_vlan_configuration(
+            self.ip_calculator.validate_vlan_configuration(
                 vlan_data.vlan_id,
                 vlan_data.subnet,
                 vlan_data.netmask
@@ -162,41 +212,58 @@ class IPManagementService:
         except Exception as e:
             raise VLANConfigurationError(f"VLAN calculation failed: {e}") from e
         
-        # Create VLAN with calculated values
+        network = self.ip_calculator.calculate_subnet_info(vlan_data.subnet, vlan_data.netmask)[0]
+        self._check_network_overlap(network)
+        
+        # Create VLAN
         vlan = VLAN(
             zone_id=vlan_data.zone_id,
             vlan_id=vlan_data.vlan_id,
             subnet=vlan_data.subnet,
             netmask=vlan_data.netmask,
-            default_gateway=calc_result["default_gateway"],
-            net_start=calc_result["net_start"],
-            net_end=calc_result["net_end"],
+            network_end=str(network.broadcast_address),
             description=vlan_data.description,
             is_active=vlan_data.is_active
         )
         
         self.db.add(vlan)
         self.db.commit()
-        self.db.refresh(vlan)
         
-        logger.info(f"Created VLAN {vlan.vlan_id} in zone {zone.name}")
+        logger.info(f"Created VLAN {vlan.vlan_id} in zone {vlan.zone_id}")
         return vlan
     
-    async def get_vlan(self, vlan_id: UUID) -> VLAN:
-        """Get VLAN by ID."""
-        vlan = self.db.query(VLAN).filter(VLAN.id == vlan_id).first()
+    def _check_network_overlap(self, network) -> None:
+        """Reject a network overlapping any existing VLAN subnet."""
+        # Existing VLAN networks never overlap, so sorted by start their ends are
+        # sorted too: only the last network starting at or before our end can overlap
+        subnet_int = type_coerce(VLAN.subnet, BigInteger)
+        candidate = self.db.execute(
+            select(VLAN.vlan_id, VLAN.subnet, type_coerce(VLAN.network_end, BigInteger))
+            .where(subnet_int <= int(network.broadcast_address))
+            .order_by(subnet_int.desc())
+            .limit(1)
+        ).first()
+        
+        if candidate and candidate[2] >= int(network.network_address):
+            raise VLANConfigurationError(
+                f"Network overlap detected: {network} overlaps VLAN {candidate[0]} ({candidate[1]})"
+            )
+    
+    def get_vlan(self, vlan_id: UUID) -> VLAN:
+        """Get VLAN by ID (served from the session identity map when already loaded)."""
+        vlan = self.db.get(VLAN, vlan_id)
         if not vlan:
             raise VLANConfigurationError(f"VLAN {vlan_id} not found")
         return vlan
     
-    async def list_vlans(self, active_only: bool = True) -> List[VLAN]:
+    def list_vlans(self, active_only: bool = True) -> List[VLAN]:
         """List all VLANs."""
         query = self.db.query(VLAN)
         if active_only:
             query = query.filter(VLAN.is_active == True)
         return query.all()
     
-    async def calculate_vlan_parameters(
+    def calculate_vlan_parameters(
         self, 
         vlan_id: int, 
         subnet: str, 
@@ -207,7 +274,7 @@ class IPManagementService:
         return VLANCalculationResult(**calc_result)
     
     # IP Assignment Management
-    async def assign_ip(self, assignment_data: IPAssignmentCreate) -> IPAssignment:
+    def assign_ip(self, assignment_data: IPAssignmentCreate) -> IPAssignment:
         """
         Assign an IP address to a device with comprehensive validation.
         
@@ -216,83 +283,153 @@ class IPManagementService:
         - IP is not reserved (first 6 + last)
         - IP is not already assigned
         - MAC address uniqueness
+        
+        IP and MAC uniqueness are enforced by the unique constraints in the
+        INSERT itself: an address taken by a concurrent request is caught
+        atomically, without a prior SELECT.
         """
-        vlan = await self.get_vlan(assignment_data.vlan_id)
+        vlan = self.get_vlan(assignment_data.vlan_id)
+        self._check_assignable(assignment_data, vlan)
         
-        # Validate IP is within VLAN subnet
+        dialect_insert = _DIALECT_INSERTS[self.db.get_bind().dialect.name]
+        stmt = (
+            dialect_insert(IPAssignment)
+            .values(**assignment_data.model_dump())
+            .on_conflict_do_nothing(index_elements=["ip_address"])
+            .returning(IPAssignment)
+        )
         try:
-            ip_addr = ipaddress.IPv4Address(assignment_data.ip_address)
-            vlan_network = ipaddress.IPv4Network(f"{vlan.subnet}{vlan.netmask}", strict=False)
-            
-            if ip_addr not in vlan_network:
-                raise IPAllocationError(f"IP {assignment_data.ip_address} not in VLAN subnet {vlan_network}")
-        except ipaddress.AddressValueError as e:
-            raise IPAllocationError(f"Invalid IP address: {e}") from e
+            assignment = self.db.scalars(stmt).first()
+        except IntegrityError as e:
+            self.db.rollback()
+            if any(marker in _violated_constraint(e) for marker in _MAC_CONFLICT_MARKERS):
+                raise IPAllocationError(f"MAC address {assignment_data.mac_address} already assigned") from e
+            raise
         
-        # Check if IP is assignable (not reserved)
-        if not self.ip_calculator.is_ip_assignable(ip_addr, vlan_network):
-            raise ReservedIPError(f"IP {assignment_data.ip_address} is reserved and cannot be assigned")
+        if assignment is None:
+            self.db.rollback()
+            raise IPAllocationError(f"IP {assignment_data.ip_address} already assigned")
+        self.db.commit()
+        
+        logger.info(f"Assigned IP {assignment.ip_address} to {assignment.ci_name}")
+        return assignment
+    
+    def assign_ips_bulk(self, assignments: List[IPAssignmentCreate]) -> List[IPAssignment]:
+        """
+        Assign a batch of IP addresses in a single transaction.
         
-        # Check for existing assignment
-        existing_ip = self.db.query(IPAssignment).filter(
-            IPAssignment.ip_address == assignment_data.ip_address
+        Applies the same rules as ``assign_ip``, but VLANs and existing IP/MAC
+        conflicts are prefetched with one IN query each and checked in memory;
+        rows are then written with one multi-row INSERT ... RETURNING. If any
+        entry fails, nothing is written.
+        """
+        if not assignments:
+            return []
+        
+        vlan_ids = {assignment_data.vlan_id for assignment_data in assignments}
+        vlans = {vlan.id: vlan for vlan in self.db.query(VLAN).filter(VLAN.id.in_(vlan_ids))}
+        
+        rows = []
+        seen_ips, seen_macs = set(), set()
+        for assignment_data in assignments:
+            vlan = vlans.get(assignment_data.vlan_id)
+            if vlan is None:
+                raise VLANConfigurationError(f"VLAN {assignment_data.vlan_id} not found")
+            self._check_assignable(assignment_data, vlan)
+            
+            if assignment_data.ip_address in seen_ips:
+                raise IPAllocationError(f"IP {assignment_data.ip_address} appears more than once in batch")
+            if assignment_data.mac_address and assignment_data.mac_address in seen_macs:
+                raise IPAllocationError(f"MAC address {assignment_data.mac_address} appears more than once in batch")
+            seen_ips.add(assignment_data.ip_address)
+            if assignment_data.mac_address:
+                seen_macs.add(assignment_data.mac_address)
+            rows.append(assignment_data.model_dump())
+        
+        existing_ip = self.db.query(IPAssignment.ip_address).filter(
+            IPAssignment.ip_address.in_(seen_ips)
         ).first()
         if existing_ip:
-            raise IPAllocationError(f"IP {assignment_data.ip_address} already assigned")
+            raise IPAllocationError(f"IP {existing_ip.ip_address} already assigned")
         
-        # Check MAC address uniqueness if provided
-        if assignment_data.mac_address:
-            existing_mac = self.db.query(IPAssignment).filter(
-                IPAssignment.mac_address == assignment_data.mac_address
+        if seen_macs:
+            existing_mac = self.db.query(IPAssignment.mac_address).filter(
+                IPAssignment.mac_address.in_(seen_macs)
             ).first()
             if existing_mac:
-                raise IPAllocationError(f"MAC address {assignment_data.mac_address} already assigned")
+                raise IPAllocationError(f"MAC address {existing_mac.mac_address} already assigned")
         
-        # Create assignment
-        assignment = IPAssignment(**assignment_data.model_dump())
-        self.db.add(assignment)
-        self.db.commit()
-        self.db.refresh(assignment)
+        try:
+            created = self.db.scalars(insert(IPAssignment).returning(IPAssignment), rows).all()
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise IPAllocationError(f"Bulk assignment conflicts with existing assignments: {e.orig}") from e
         
-        logger.info(f"Assigned IP {assignment.ip_address} to {assignment.ci_name}")
-        return assignment
+        logger.info(f"Assigned {len(created)} IPs in bulk")
+        return created
     
-    async def get_next_available_ip(self, vlan_id: UUID) -> Optional[str]:
-        """Get the next available IP address in a VLAN."""
-        vlan = await self.get_vlan(vlan_id)
+    def _check_assignable(self, assignment_data: IPAssignmentCreate, vlan: VLAN) -> None:
+        """Check the IP lies in the VLAN subnet and outside its reserved ranges."""
+        # Integer mask compare; no IPv4Address construction on the hot path
+        try:
+            ip_int = ip_to_int(assignment_data.ip_address)
+        except OSError as e:
+            raise IPAllocationError(f"Invalid IP address: {e}") from e
         
-        # Get all assigned IPs in this VLAN
-        assigned_ips = self.db.query(IPAssignment.ip_address).filter(
-            and_(
-                IPAssignment.vlan_id == vlan_id,
-                IPAssignment.is_active == True
-            )
-        ).all()
-        assigned_set = {ip[0] for ip in assigned_ips}
+        vlan_network = vlan.network
+        if ip_int & int(vlan_network.netmask) != int(vlan_network.network_address):
+            raise IPAllocationError(f"IP {assignment_data.ip_address} not in VLAN subnet {vlan_network}")
+        
+        # Check if IP is assignable (not reserved); membership was checked above
+        first_assignable, last_assignable = self.ip_calculator.assignable_bounds(vlan_network)
+        if not first_assignable <= ip_int <= last_assignable:
+            raise ReservedIPError(f"IP {assignment_data.ip_address} is reserved and cannot be assigned")
+    
+    def get_next_available_ip(self, vlan_id: UUID) -> Optional[str]:
+        """Get the next available IP address in a VLAN."""
+        vlan = self.get_vlan(vlan_id)
         
-        # Generate available IPs
         try:
-            vlan_network = ipaddress.IPv4Network(f"{vlan.subnet}{vlan.netmask}", strict=False)
-            
-            for host_ip in vlan_network.hosts():
-                if (str(host_ip) not in assigned_set and 
-                    self.ip_calculator.is_ip_assignable(host_ip, vlan_network)):
-                    return str(host_ip)
-                    
-        except Exception as e:
+            vlan_network = vlan.network
+        except ValueError as e:
             logger.error(f"Error finding available IP: {e}")
             return None
         
-        return None
+        # Assignable range as integers; reserved head/tail are simply outside it
+        start, end = self.ip_calculator.assignable_bounds(vlan_network)
+        
+        # Stream assigned in-range IPs in address order as raw integers, read in
+        # index order from ix_ip_vlan_active_addr; the scan stops at the first
+        # page with a gap, so dense VLANs are not read in full
+        assigned_pages = self.db.execute(
+            select(type_coerce(IPAssignment.ip_address, BigInteger))
+            .where(
+                IPAssignment.vlan_id == vlan_id,
+                IPAssignment.is_active == True,
+                type_coerce(IPAssignment.ip_address, BigInteger).between(start, end)
+            )
+            .order_by(IPAssignment.ip_address)
+            .execution_options(yield_per=1000)
+        ).scalars().partitions()
+        
+        free_ip = self.ip_calculator.first_free_address(start, end, assigned_pages)
+        return int_to_ip(free_ip) if free_ip is not None else None
     
-    async def get_ip_availability(self, vlan_id: UUID) -> IPAvailabilityResponse:
+    def get_ip_availability(self, vlan_id: UUID) -> IPAvailabilityResponse:
         """Get IP availability statistics for a VLAN."""
-        vlan = await self.get_vlan(vlan_id)
+        # VLAN row and active assignment count in one round-trip
+        row = self.db.query(VLAN, func.count(IPAssignment.id)).outerjoin(
+            IPAssignment,
+            and_(IPAssignment.vlan_id == VLAN.id, IPAssignment.is_active == True)
+        ).filter(VLAN.id == vlan_id).group_by(VLAN.id).first()
+        if not row:
+            raise VLANConfigurationError(f"VLAN {vlan_id} not found")
+        vlan, assigned_count = row
         
         # Calculate total IPs
         try:
-            vlan_network = ipaddress.IPv4Network(f"{vlan.subnet}{vlan.netmask}", strict=False)
-            total_hosts = vlan_network.num_addresses - 2  # Exclude network and broadcast
+            total_hosts = vlan.total_ips
             
             # Count reserved IPs
             reserved_count = (
@@ -300,15 +437,7 @@ class IPManagementService:
                 self.ip_calculator.RESERVED_END_COUNT
             )
             
-            # Count assigned IPs
-            assigned_count = self.db.query(IPAssignment).filter(
-                and_(
-                    IPAssignment.vlan_id == vlan_id,
-                    IPAssignment.is_active == True
-                )
-            ).count()
-            
-            assignable_total = total_hosts - reserved_count
+            assignable_total = vlan.assignable_ips
             available_count = assignable_total - assigned_count
             utilization = (assigned_count / assignable_total * 100) if assignable_total > 0 else 0
             
@@ -325,7 +454,7 @@ class IPManagementService:
             logger.error(f"Error calculating IP availability: {e}")
             raise VLANConfigurationError(f"Failed to calculate IP availability: {e}") from e
     
-    async def release_ip(self, assignment_id: UUID) -> bool:
+    def release_ip(self, assignment_id: UUID) -> bool:
         """Release an IP assignment."""
         assignment = self.db.query(IPAssignment).filter(IPAssignment.id == assignment_id).first()
         if not assignment:
@@ -338,69 +467,118 @@ class IPManagementService:
         return True
     
     # Audit and Reporting
-    async def get_network_hierarchy(self, domain_id: Optional[UUID] = None) -> Dict[str, Any]:
-        """Get complete network hierarchy for reporting."""
-        query = self.db.query(Domain)
+    def get_network_hierarchy(self, domain_id: Optional[UUID] = None) -> Dict[str, Any]:
+        """
+        Get complete network hierarchy for reporting.
+        
+        All four levels come from one flat LEFT OUTER JOIN; rows are folded
+        into the tree in a single pass, indexing each level by id so every
+        object is placed exactly once. Each level holds a plain dict of the
+        report columns, so the result can be returned as JSON directly.
+        """
+        query = self.db.query(Domain, ValueStream, Zone, VLAN).outerjoin(
+            ValueStream, ValueStream.domain_id == Domain.id
+        ).outerjoin(
+            Zone, Zone.value_stream_id == ValueStream.id
+        ).outerjoin(
+            VLAN, VLAN.zone_id == Zone.id
+        ).options(*hierarchy_report_loader_options())
         if domain_id:
             query = query.filter(Domain.id == domain_id)
         
-        domains = query.all()
-        
-        hierarchy = []
-        for domain in domains:
-            domain_data = {
-                "domain": domain,
-                "value_streams": []
-            }
-            
-            for vs in domain.value_streams:
-                vs_data = {
-                    "value_stream": vs,
-                    "zones": []
+        tree: Dict[UUID, Dict[str, Any]] = {}
+        for domain, vs, zone, vlan in query:
+            domain_data = tree.get(domain.id)
+            if domain_data is None:
+                domain_data = tree[domain.id] = {
+                    "domain": _report_fields(domain, "id", "code", "name", "is_active"),
+                    "value_streams": {}
                 }
-                
-                for zone in vs.zones:
-                    zone_data = {
-                        "zone": zone,
-                        "vlans": zone.vlans
-                    }
-                    vs_data["zones"].append(zone_data)
-                
-                domain_data["value_streams"].append(vs_data)
-            
-            hierarchy.append(domain_data)
+            if vs is None:
+                continue
+            vs_data = domain_data["value_streams"].get(vs.id)
+            if vs_data is None:
+                vs_data = domain_data["value_streams"][vs.id] = {
+                    "value_stream": _report_fields(vs, "id", "code", "name", "is_active"),
+                    "zones": {}
+                }
+            if zone is None:
+                continue
+            zone_data = vs_data["zones"].get(zone.id)
+            if zone_data is None:
+                zone_data = vs_data["zones"][zone.id] = {
+                    "zone": _report_fields(
+                        zone, "id", "name", "security_type", "zone_manager", "is_active"
+                    ),
+                    "vlans": []
+                }
+            if vlan is not None:
+                zone_data["vlans"].append(
+                    _report_fields(vlan, "id", "vlan_id", "subnet", "netmask", "is_active")
+                )
         
-        return {"hierarchy": hierarchy}
-    
-    async def get_security_compliance_report(self) -> Dict[str, Any]:
-        """Generate security compliance report for audit purposes."""
-        zones_by_security = {}
-        
-        for security_type in SecurityType:
-            zones = self.db.query(Zone).filter(Zone.security_type == security_type.value).all()
-            zones_by_security[security_type.value] = {
-                "count": len(zones),
-                "zones": zones,
-                "last_firewall_checks": [
+        hierarchy = [
+            {
+                "domain": domain_data["domain"],
+                "value_streams": [
                     {
-                        "zone_name": zone.name,
-                        "last_check": zone.last_firewall_check,
-                        "overdue": (
-                            zone.last_firewall_check is None or
-                            (datetime.utcnow() - zone.last_firewall_check).days > 30
-                        ) if zone.last_firewall_check else True
+                        "value_stream": vs_data["value_stream"],
+                        "zones": list(vs_data["zones"].values())
                     }
-                    for zone in zones
+                    for vs_data in domain_data["value_streams"].values()
                 ]
             }
+            for domain_data in tree.values()
+        ]
+        
+        return {"hierarchy": hierarchy}
+    
+    def get_security_compliance_report(self, detailed: bool = False) -> Dict[str, Any]:
+        """
+        Generate security compliance report for audit purposes.
+        
+        Counts come from a single GROUP BY over zones; per-zone firewall check
+        details are only loaded when ``detailed`` is set.
+        """
+        # Overdue: never checked, or last check more than 30 full days ago
+        cutoff = datetime.now(timezone.utc) - timedelta(days=31)
+        is_overdue = or_(Zone.last_firewall_check == None, Zone.last_firewall_check <= cutoff)
+        
+        counts = self.db.query(
+            Zone.security_type,
+            func.count().label("total"),
+            func.sum(case((is_overdue, 1), else_=0)).label("overdue")
+        ).group_by(Zone.security_type).all()
+        
+        zones_by_security = {
+            security_type.value: {"count": 0, "overdue": 0} for security_type in SecurityType
+        }
+        total_zones = overdue_checks = 0
+        for security_type, total, overdue in counts:
+            overdue = int(overdue or 0)
+            zones_by_security[security_type.value] = {"count": total, "overdue": overdue}
+            total_zones += total
+            overdue_checks += overdue
+        
+        if detailed:
+            for data in zones_by_security.values():
+                data["last_firewall_checks"] = []
+            
+            # Plain values only: the report is returned as JSON as-is
+            rows = self.db.query(
+                Zone.security_type, Zone.name, Zone.last_firewall_check, is_overdue
+            ).order_by(Zone.security_type, Zone.name).all()
+            for security_type, zone_name, last_check, overdue in rows:
+                zones_by_security[security_type.value]["last_firewall_checks"].append({
+                    "zone_name": zone_name,
+                    "last_check": last_check,
+                    "overdue": bool(overdue)
+                })
         
         return {
             "security_zones": zones_by_security,
             "compliance_summary": {
-                "total_zones": sum(data["count"] for data in zones_by_security.values()),
-                "overdue_firewall_checks": sum(
-                    sum(1 for check in data["last_firewall_checks"] if check["overdue"])
-                    for data in zones_by_security.values()
-                )
+                "total_zones": total_zones,
+                "overdue_firewall_checks": overdue_checks
             }
         }
\ No newline at end of file
@@ -5,71 +5,169 @@ Provides database fixtures, test clients, and mock data for comprehensive testin
 of industrial network management functionality.
 """
 
+import json
+from datetime import datetime, timedelta, timezone
 import pytest
-import asyncio
-from typing import Generator, AsyncGenerator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from typing import AsyncGenerator, Callable, Dict, Generator, List
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import configure_mappers, sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 
-from src.ip_management.models.database import Base
+from src.ip_management.models.database import Base, Domain, VLAN
 from src.ip_management.api.main import app
-from src.ip_management.config.database import get_db
+from src.ip_management.config.database import get_db, get_async_db
+from src.ip_management.config.strict_loading import enable_strict_loading
 from src.ip_management.services.ip_service import IPManagementService
+from src.ip_management.models.schemas import DomainCreate, ValueStreamCreate, VLANCreate, ZoneCreate
 
-# Test database URL (SQLite for testing)
-TEST_DATABASE_URL = "sqlite:///./test_ip_management.db"
+# Resolve relationships once per process (each xdist worker) at collection,
+# rather than inside whichever test first touches a model
+configure_mappers()
+
+# Test database URL (in-memory SQLite, one shared connection for all tests).
+# The database lives in the test process, so each pytest-xdist worker
+# (``pytest -n auto``) gets its own isolated copy.
+TEST_DATABASE_URL = "sqlite://"
+
+# Bulk imports run on an AsyncSession (asyncpg in production); tests use aiosqlite
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite://"
 
 # Create test engine
 test_engine = create_engine(
     TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
+
+
+# Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+@event.listens_for(test_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=test_engine
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+# Fail tests on any relationship access that was not explicitly eager-loaded
+enable_strict_loading(TestingSessionLocal)
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def db_connection() -> Generator[Connection, None, None]:
+    """
+    Open one connection for the whole test session and create the schema on it.
+    
+    Everything runs inside a single outer transaction that is rolled back at
+    the end of the session.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    Base.metadata.create_all(bind=connection)
+    
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
-def db_session() -> Generator[Session, None, None]:
-    """Create a fresh database session for each test."""
-    # Create tables
-    Base.metadata.create_all(bind=test_engine)
+def db_session(db_connection: Connection) -> Generator[Session, None, None]:
+    """
+    Create a database session for each test inside a SAVEPOINT.
     
-    # Create session
-    session = TestingSessionLocal()
+    Service commits release nested SAVEPOINTs; the per-test SAVEPOINT is
+    rolled back at teardown, so tests stay isolated without per-test DDL.
+    """
+    savepoint = db_connection.begin_nested()
+    session = TestingSessionLocal(bind=db_connection, join_transaction_mode="create_savepoint")
     
     try:
         yield session
     finally:
         session.close()
-        # Drop tables after test
-        Base.metadata.drop_all(bind=test_engine)
+        savepoint.rollback()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create one in-process ASGI client for the whole test session.
+    
+    Requests are dispatched straight to the app (no sockets, no portal
+    thread). The host must pass TrustedHostMiddleware.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost") as client:
+        yield client
 
 
 @pytest.fixture(scope="function")
-def test_client(db_session: Session) -> TestClient:
-    """Create a test client with database dependency override."""
+def async_client(app_client: AsyncClient, db_session: Session) -> Generator[AsyncClient, None, None]:
+    """Point the shared client at this test's database session."""
     
     def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
+        yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
     
-    with TestClient(app) as client:
-        yield client
+    try:
+        yield app_client
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def async_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Create a fresh in-memory aiosqlite database for the async bulk import path.
+    
+    Imports commit their own transaction, so instead of a SAVEPOINT each
+    test gets its own database, separate from ``db_connection``.
+    """
+    engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def async_session_factory(async_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Session factory on this test's async database, configured like ``get_async_db``."""
+    return async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+@pytest.fixture(scope="function")
+def async_import_client(
+    app_client: AsyncClient,
+    async_session_factory: async_sessionmaker[AsyncSession]
+) -> Generator[AsyncClient, None, None]:
+    """Point the shared client's async sessions at this test's aiosqlite database."""
+    
+    async def override_get_async_db():
+        async with async_session_factory() as session:
+            yield session
     
-    app.dependency_overrides.clear()
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    
+    try:
+        yield app_client
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
 
 
 @pytest.fixture(scope="function")
@@ -78,7 +176,23 @@ def ip_service(db_session: Session) -> IPManagementService:
     return IPManagementService(db_session)
 
 
-@pytest.fixture
+@pytest.fixture(scope="function")
+def create_domains(db_session: Session) -> Callable[[List[Dict]], None]:
+    """
+    Insert domain rows with one multi-row INSERT.
+    
+    For tests that only need domains to exist (listing, timing); creation
+    itself is covered through the service and API tests.
+    """
+    
+    def _create(rows: List[Dict]) -> None:
+        db_session.execute(insert(Domain), rows)
+        db_session.commit()
+    
+    return _create
+
+
+@pytest.fixture(scope="session")
 def sample_domain_data():
     """Sample domain data for testing."""
     return {
@@ -89,7 +203,13 @@ def sample_domain_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_domain_json(sample_domain_data) -> bytes:
+    """``sample_domain_data`` serialized once for raw ``content=`` request bodies."""
+    return json.dumps(sample_domain_data).encode()
+
+
+@pytest.fixture(scope="session")
 def sample_value_stream_data():
     """Sample value stream data for testing."""
     return {
@@ -100,7 +220,7 @@ def sample_value_stream_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_zone_data():
     """Sample zone data for testing."""
     return {
@@ -112,7 +232,7 @@ def sample_zone_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_vlan_data():
     """Sample VLAN data for testing."""
     return {
@@ -124,7 +244,7 @@ def sample_vlan_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ip_assignment_data():
     """Sample IP assignment data for testing."""
     return {
@@ -136,33 +256,117 @@ def sample_ip_assignment_data():
     }
 
 
-@pytest.fixture
-async def populated_database(
+@pytest.fixture(scope="function")
+def vlan_ready_zone(
+    ip_service: IPManagementService,
+    sample_domain_data,
+    sample_value_stream_data,
+    sample_zone_data
+) -> Dict:
+    """
+    Create the domain -> value stream -> zone chain a VLAN needs.
+    
+    Built through the service on the test's session, so VLAN API tests
+    only POST the VLAN itself.
+    """
+    domain = ip_service.create_domain(DomainCreate(**sample_domain_data))
+    value_stream = ip_service.create_value_stream(
+        ValueStreamCreate(**sample_value_stream_data, domain_id=domain.id)
+    )
+    zone = ip_service.create_zone(ZoneCreate(**sample_zone_data, value_stream_id=value_stream.id))
+    
+    return {
+        "domain_id": str(domain.id),
+        "vs_id": str(value_stream.id),
+        "zone_id": str(zone.id)
+    }
+
+
+@pytest.fixture(scope="function")
+def populated_database(
     ip_service: IPManagementService,
     sample_domain_data,
     sample_value_stream_data,
     sample_zone_data,
     sample_vlan_data
 ):
-    """Create a populated database with sample data for integration tests."""
+    """
+    Create a populated database with sample data for integration tests.
+    
+    Function-scoped like ``db_session``: a shared graph would leak its
+    domain code into tests in the same module that create it themselves.
+    """
     # Create domain
-    domain = await ip_service.create_domain(sample_domain_data)
+    domain = ip_service.create_domain(DomainCreate(**sample_domain_data))
     
     # Create value stream
-    vs_data = {**sample_value_stream_data, "domain_id": domain.id}
-    value_stream = await ip_service.create_value_stream(vs_data)
+    vs_data = ValueStreamCreate(**sample_value_stream_data, domain_id=domain.id)
+    value_stream = ip_service.create_value_stream(vs_data)
     
     # Create zone
-    zone_data = {**sample_zone_data, "value_stream_id": value_stream.id}
-    zone = await ip_service.create_zone(zone_data)
+    zone_data = ZoneCreate(**sample_zone_data, value_stream_id=value_stream.id)
+    zone = ip_service.create_zone(zone_data)
     
     # Create VLAN
-    vlan_data = {**sample_vlan_data, "zone_id": zone.id}
-    vlan = await ip_service.create_vlan(vlan_data)
+    vlan_data = VLANCreate(**sample_vlan_data, zone_id=zone.id)
+    vlan = ip_service.create_vlan(vlan_data)
     
     return {
         "domain": domain,
         "value_stream": value_stream,
         "zone": zone,
         "vlan": vlan
-    }
\ No newline at end of file
+    }
+
+
+@pytest.fixture(scope="function")
+def firewall_check_zones(ip_service: IPManagementService, populated_database) -> Dict:
+    """
+    Add zones around the 31-day overdue boundary next to the fixture zone.
+    
+    The ``populated_database`` zone (MFZ_SL4) has never been checked.
+    """
+    vs_id = populated_database["value_stream"].id
+    now = datetime.now(timezone.utc)
+    
+    def make_zone(name, security_type, last_check):
+        return ip_service.create_zone(ZoneCreate(
+            name=name,
+            security_type=security_type,
+            last_firewall_check=last_check,
+            value_stream_id=vs_id
+        ))
+    
+    return {
+        "overdue": make_zone("Checked 31 days ago", "MFZ_SL4", now - timedelta(days=31)),
+        "due_soon": make_zone("Checked just under 31 days ago", "MFZ_SL4", now - timedelta(days=31) + timedelta(minutes=1)),
+        "recent": make_zone("Checked yesterday", "ENG_SL4", now - timedelta(days=1)),
+    }
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def async_vlan(
+    async_session_factory: async_sessionmaker[AsyncSession],
+    sample_domain_data,
+    sample_value_stream_data,
+    sample_zone_data,
+    sample_vlan_data
+) -> VLAN:
+    """
+    Create the sample hierarchy in the async test database and return its VLAN.
+    
+    Built through the sync service via ``run_sync``, so the rows match what
+    ``populated_database`` creates.
+    """
+    
+    def build(session: Session) -> VLAN:
+        service = IPManagementService(session)
+        domain = service.create_domain(DomainCreate(**sample_domain_data))
+        value_stream = service.create_value_stream(
+            ValueStreamCreate(**sample_value_stream_data, domain_id=domain.id)
+        )
+        zone = service.create_zone(ZoneCreate(**sample_zone_data, value_stream_id=value_stream.id))
+        return service.create_vlan(VLANCreate(**sample_vlan_data, zone_id=zone.id))
+    
+    async with async_session_factory() as session:
+        return await session.run_sync(build)
@@ -6,19 +6,27 @@ according to industrial IT/OT security requirements.
 """
 
 import pytest
+import asyncio
 import json
-from fastapi.testclient import TestClient
+import time
+from httpx import AsyncClient
 from uuid import uuid4
 
 from src.ip_management.models.schemas import DomainCreate, VLANCreate
 
+# Share the session-scoped client's event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# For requests that send pre-serialized bodies via ``content=``
+JSON_HEADERS = {"content-type": "application/json"}
+
 
 class TestDomainAPI:
     """Test suite for Domain API endpoints."""
     
-    def test_create_domain_success(self, test_client: TestClient, sample_domain_data):
+    async def test_create_domain_success(self, async_client: AsyncClient, sample_domain_data, sample_domain_json):
         """Test successful domain creation via API."""
-        response = test_client.post("/api/v1/domains", json=sample_domain_data)
+        response = await async_client.post("/api/v1/domains", content=sample_domain_json, headers=JSON_HEADERS)
         
         assert response.status_code == 201
         data = response.json()
@@ -28,7 +36,7 @@ class TestDomainAPI:
         assert "id" in data
         assert "created_at" in data
     
-    def test_create_domain_invalid_data(self, test_client: TestClient):
+    async def test_create_domain_invalid_data(self, async_client: AsyncClient):
         """Test domain creation with invalid data."""
         invalid_data = {
             "code": "",  # Empty code
@@ -36,71 +44,76 @@ class TestDomainAPI:
             # Missing required fields
         }
         
-        response = test_client.post("/api/v1/domains", json=invalid_data)
+        response = await async_client.post("/api/v1/domains", json=invalid_data)
         assert response.status_code == 422  # Validation error
     
-    def test_create_domain_duplicate_code(self, test_client: TestClient, sample_domain_data):
+    async def test_create_domain_duplicate_code(self, async_client: AsyncClient, sample_domain_json):
         """Test domain creation with duplicate code."""
         # Create first domain
-        response1 = test_client.post("/api/v1/domains", json=sample_domain_data)
+        response1 = await async_client.post("/api/v1/domains", content=sample_domain_json, headers=JSON_HEADERS)
         assert response1.status_code == 201
         
         # Attempt duplicate
-        response2 = test_client.post("/api/v1/domains", json=sample_domain_data)
+        response2 = await async_client.post("/api/v1/domains", content=sample_domain_json, headers=JSON_HEADERS)
         assert response2.status_code == 409  # Conflict
         assert "already exists" in response2.json()["detail"]
     
-    def test_get_domain_by_id_success(self, test_client: TestClient, sample_domain_data):
+    async def test_get_domain_by_id_success(self, async_client: AsyncClient, sample_domain_data, sample_domain_json):
         """Test retrieving domain by ID."""
         # Create domain
-        create_response = test_client.post("/api/v1/domains", json=sample_domain_data)
+        create_response = await async_client.post("/api/v1/domains", content=sample_domain_json, headers=JSON_HEADERS)
         domain_id = create_response.json()["id"]
         
         # Retrieve domain
-        response = test_client.get(f"/api/v1/domains/{domain_id}")
+        response = await async_client.get(f"/api/v1/domains/{domain_id}")
         assert response.status_code == 200
         
         data = response.json()
         assert data["id"] == domain_id
         assert data["code"] == sample_domain_data["code"]
     
-    def test_get_domain_by_id_not_found(self, test_client: TestClient):
+    async def test_get_domain_by_id_not_found(self, async_client: AsyncClient):
         """Test retrieving non-existent domain."""
         non_existent_id = str(uuid4())
-        response = test_client.get(f"/api/v1/domains/{non_existent_id}")
+        response = await async_client.get(f"/api/v1/domains/{non_existent_id}")
         assert response.status_code == 404
     
-    def test_list_domains_empty(self, test_client: TestClient):
+    async def test_list_domains_empty(self, async_client: AsyncClient):
         """Test listing domains when none exist."""
-        response = test_client.get("/api/v1/domains")
+        response = await async_client.get("/api/v1/domains")
         assert response.status_code == 200
         assert response.json() == []
     
-    def test_list_domains_with_data(self, test_client: TestClient):
+    async def test_list_domains_with_data(self, async_client: AsyncClient, create_domains):
         """Test listing domains with existing data."""
-        domains_data = [
+        create_domains([
             {"code": "MFG", "name": "Manufacturing", "description": "Manufacturing domain", "is_active": True},
             {"code": "LOG", "name": "Logistics", "description": "Logistics domain", "is_active": True}
-        ]
-        
-        # Create domains
-        for domain_data in domains_data:
-            response = test_client.post("/api/v1/domains", json=domain_data)
-            assert response.status_code == 201
+        ])
         
         # List domains
-        response = test_client.get("/api/v1/domains")
+        response = await async_client.get("/api/v1/domains")
         assert response.status_code == 200
         
         data = response.json()
         assert len(data) == 2
         codes = {d["code"] for d in data}
         assert codes == {"MFG", "LOG"}
+        assert all(d["value_streams"] == [] for d in data)
+    
+    async def test_list_domain_summaries(self, async_client: AsyncClient, populated_database):
+        """Test the summary listing returns domain rows without the hierarchy."""
+        response = await async_client.get("/api/v1/domains/summary")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert [d["code"] for d in data] == [populated_database["domain"].code]
+        assert "value_streams" not in data[0]
     
-    def test_update_domain_success(self, test_client: TestClient, sample_domain_data):
+    async def test_update_domain_success(self, async_client: AsyncClient, sample_domain_data, sample_domain_json):
         """Test successful domain update."""
         # Create domain
-        create_response = test_client.post("/api/v1/domains", json=sample_domain_data)
+        create_response = await async_client.post("/api/v1/domains", content=sample_domain_json, headers=JSON_HEADERS)
         domain_id = create_response.json()["id"]
         
         # Update domain
@@ -110,7 +123,7 @@ class TestDomainAPI:
             "is_active": False
         }
         
-        response = test_client.put(f"/api/v1/domains/{domain_id}", json=update_data)
+        response = await async_client.put(f"/api/v1/domains/{domain_id}", json=update_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -119,41 +132,29 @@ class TestDomainAPI:
         assert data["is_active"] == False
         assert data["code"] == sample_domain_data["code"]  # Code unchanged
     
-    def test_delete_domain_success(self, test_client: TestClient, sample_domain_data):
+    async def test_delete_domain_success(self, async_client: AsyncClient, sample_domain_json):
         """Test successful domain deletion."""
         # Create domain
-        create_response = test_client.post("/api/v1/domains", json=sample_domain_data)
+        create_response = await async_client.post("/api/v1/domains", content=sample_domain_json, headers=JSON_HEADERS)
         domain_id = create_response.json()["id"]
         
         # Delete domain
-        response = test_client.delete(f"/api/v1/domains/{domain_id}")
+        response = await async_client.delete(f"/api/v1/domains/{domain_id}")
         assert response.status_code == 204
         
         # Verify deletion
-        get_response = test_client.get(f"/api/v1/domains/{domain_id}")
+        get_response = await async_client.get(f"/api/v1/domains/{domain_id}")
         assert get_response.status_code == 404
 
 
 class TestVLANAPI:
     """Test suite for VLAN API endpoints."""
     
-    def test_create_vlan_success(self, test_client: TestClient, sample_domain_data, sample_value_stream_data, sample_zone_data):
+    async def test_create_vlan_success(self, async_client: AsyncClient, vlan_ready_zone):
         """Test successful VLAN creation via API."""
-        # Create prerequisite data
-        domain_response = test_client.post("/api/v1/domains", json=sample_domain_data)
-        domain_id = domain_response.json()["id"]
-        
-        vs_data = {**sample_value_stream_data, "domain_id": domain_id}
-        vs_response = test_client.post("/api/v1/value-streams", json=vs_data)
-        vs_id = vs_response.json()["id"]
-        
-        zone_data = {**sample_zone_data, "value_stream_id": vs_id}
-        zone_response = test_client.post("/api/v1/zones", json=zone_data)
-        zone_id = zone_response.json()["id"]
-        
         # Create VLAN
         vlan_data = {
-            "zone_id": zone_id,
+            "zone_id": vlan_ready_zone["zone_id"],
             "vlan_id": 100,
             "subnet": "192.168.100.0",
             "netmask": "/24",
@@ -161,7 +162,7 @@ class TestVLANAPI:
             "is_active": True
         }
         
-        response = test_client.post("/api/v1/vlans", json=vlan_data)
+        response = await async_client.post("/api/v1/vlans", json=vlan_data)
         assert response.status_code == 201
         
         data = response.json()
@@ -172,23 +173,11 @@ class TestVLANAPI:
         assert data["net_start"] == "192.168.100.7"
         assert data["net_end"] == "192.168.100.253"
     
-    def test_create_vlan_invalid_subnet(self, test_client: TestClient, sample_domain_data, sample_value_stream_data, sample_zone_data):
+    async def test_create_vlan_invalid_subnet(self, async_client: AsyncClient, vlan_ready_zone):
         """Test VLAN creation with invalid subnet."""
-        # Create prerequisite data (simplified for test)
-        domain_response = test_client.post("/api/v1/domains", json=sample_domain_data)
-        domain_id = domain_response.json()["id"]
-        
-        vs_data = {**sample_value_stream_data, "domain_id": domain_id}
-        vs_response = test_client.post("/api/v1/value-streams", json=vs_data)
-        vs_id = vs_response.json()["id"]
-        
-        zone_data = {**sample_zone_data, "value_stream_id": vs_id}
-        zone_response = test_client.post("/api/v1/zones", json=zone_data)
-        zone_id = zone_response.json()["id"]
-        
         # Attempt VLAN with invalid subnet
         vlan_data = {
-            "zone_id": zone_id,
+            "zone_id": vlan_ready_zone["zone_id"],
             "vlan_id": 100,
             "subnet": "invalid.subnet",
             "netmask": "/24",
@@ -196,29 +185,70 @@ class TestVLANAPI:
             "is_active": True
         }
         
-        response = test_client.post("/api/v1/vlans", json=vlan_data)
-        assert response.status_code == 400
-        assert "Invalid subnet" in response.json()["detail"]
+        response = await async_client.post("/api/v1/vlans", json=vlan_data)
+        assert response.status_code == 422
+        assert "Invalid subnet" in response.json()["details"][0]["msg"]
     
-    def test_assign_ip_success(self, test_client: TestClient):
+    async def test_assign_ip_success(self, async_client: AsyncClient):
         """Test successful IP assignment via API."""
         # This test would require full setup chain
         # Simplified for demonstration
         pass
     
-    def test_get_vlan_utilization(self, test_client: TestClient):
+    async def test_get_vlan_utilization(self, async_client: AsyncClient):
         """Test VLAN utilization endpoint."""
         # This test would require VLAN with IP assignments
         # Simplified for demonstration
         pass
 
 
+class TestIPImportAPI:
+    """Test suite for the async bulk IP import endpoint."""
+    
+    async def test_import_ip_assignments(self, async_import_client: AsyncClient, async_vlan):
+        """Test a valid batch is imported and counted."""
+        payload = [
+            {"vlan_id": str(async_vlan.id), "ip_address": f"192.168.100.{host}", "ci_name": f"DEVICE-{host:03d}"}
+            for host in range(10, 13)
+        ]
+        
+        response = await async_import_client.post("/api/v1/ip-assignments/import", json=payload)
+        assert response.status_code == 201
+        assert response.json() == {"imported": 3}
+    
+    async def test_import_reserved_ip(self, async_import_client: AsyncClient, async_vlan):
+        """Test a reserved address in the batch is rejected with 400."""
+        payload = [{"vlan_id": str(async_vlan.id), "ip_address": "192.168.100.2", "ci_name": "GATEWAY-2"}]
+        
+        response = await async_import_client.post("/api/v1/ip-assignments/import", json=payload)
+        assert response.status_code == 400
+        assert "reserved" in response.json()["detail"]
+    
+    async def test_import_conflict(self, async_import_client: AsyncClient, async_vlan):
+        """Test importing an already assigned address is rejected with 400."""
+        payload = [{"vlan_id": str(async_vlan.id), "ip_address": "192.168.100.10", "ci_name": "PLC-A2-001"}]
+        
+        response = await async_import_client.post("/api/v1/ip-assignments/import", json=payload)
+        assert response.status_code == 201
+        
+        response = await async_import_client.post("/api/v1/ip-assignments/import", json=payload)
+        assert response.status_code == 400
+        assert "conflicts with existing assignments" in response.json()["detail"]
+    
+    async def test_import_invalid_payload(self, async_import_client: AsyncClient, async_vlan):
+        """Test malformed rows are rejected with 422 before touching the database."""
+        payload = [{"vlan_id": str(async_vlan.id), "ip_address": "not-an-ip", "ci_name": "BROKEN"}]
+        
+        response = await async_import_client.post("/api/v1/ip-assignments/import", json=payload)
+        assert response.status_code == 422
+
+
 class TestHealthAPI:
     """Test suite for Health and monitoring endpoints."""
     
-    def test_health_check(self, test_client: TestClient):
+    async def test_health_check(self, async_client: AsyncClient):
         """Test health check endpoint."""
-        response = test_client.get("/health")
+        response = await async_client.get("/health")
         assert response.status_code == 200
         
         data = response.json()
@@ -226,9 +256,9 @@ class TestHealthAPI:
         assert "service" in data
         assert "version" in data
     
-    def test_api_info(self, test_client: TestClient):
+    async def test_api_info(self, async_client: AsyncClient):
         """Test API information endpoint."""
-        response = test_client.get("/api/v1/info")
+        response = await async_client.get("/api/v1/info")
         assert response.status_code == 200
         
         data = response.json()
@@ -239,77 +269,121 @@ class TestHealthAPI:
 class TestSecurityAPI:
     """Test suite for API security features."""
     
-    def test_cors_headers(self, test_client: TestClient):
+    async def test_cors_headers(self, async_client: AsyncClient):
         """Test CORS headers are properly set."""
-        response = test_client.options("/api/v1/domains")
+        response = await async_client.options(
+            "/api/v1/domains",
+            headers={"Origin": "http://localhost:3000", "Access-Control-Request-Method": "GET"}
+        )
         assert response.status_code == 200
-        # CORS headers would be checked here
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert "GET" in response.headers["access-control-allow-methods"]
     
-    def test_input_validation_sql_injection(self, test_client: TestClient):
-        """Test protection against SQL injection attempts."""
-        malicious_data = {
+    @pytest.mark.parametrize("malicious_data, expected_statuses", [
+        # SQL injection: must be rejected by validation
+        ({
             "code": "'; DROP TABLE domains; --",
             "name": "Malicious Domain",
             "description": "SQL injection test",
             "is_active": True
-        }
-        
-        response = test_client.post("/api/v1/domains", json=malicious_data)
-        # Should be rejected due to validation
-        assert response.status_code in [400, 422]
-    
-    def test_input_validation_xss(self, test_client: TestClient):
-        """Test protection against XSS attempts."""
-        xss_data = {
+        }, {400, 422}),
+        # XSS: may be rejected, or stored with script tags escaped/sanitized
+        ({
             "code": "XSS",
             "name": "<script>alert('xss')</script>",
             "description": "XSS test",
             "is_active": True
-        }
+        }, {201, 400, 422}),
+    ], ids=["sql_injection", "xss"])
+    async def test_input_validation_malicious_payload(self, async_client: AsyncClient, malicious_data, expected_statuses):
+        """Test protection against SQL injection and XSS attempts."""
+        response = await async_client.post("/api/v1/domains", json=malicious_data)
+        assert response.status_code in expected_statuses
         
-        response = test_client.post("/api/v1/domains", json=xss_data)
         if response.status_code == 201:
-            # If created, ensure script tags are escaped/sanitized
             data = response.json()
             assert "<script>" not in data["name"]
     
-    def test_rate_limiting(self, test_client: TestClient):
+    @pytest.mark.skip(reason="Rate limiting not implemented")
+    async def test_rate_limiting(self, async_client: AsyncClient):
         """Test API rate limiting (if implemented)."""
-        # Make multiple rapid requests
-        responses = []
-        for i in range(100):
-            response = test_client.get("/api/v1/domains")
-            responses.append(response.status_code)
-        
-        # Check if rate limiting kicks in
-        # This would depend on rate limiting implementation
+        # Should fire rapid requests and expect 429 once a limiter exists
         pass
 
 
+class TestReportsAPI:
+    """Test suite for reporting endpoints."""
+    
+    async def test_network_hierarchy_report(self, async_client: AsyncClient, populated_database):
+        """Test the hierarchy report route serializes all levels."""
+        response = await async_client.get("/api/v1/reports/network-hierarchy")
+        assert response.status_code == 200
+        
+        domain_entry = response.json()["hierarchy"][0]
+        assert domain_entry["domain"]["id"] == str(populated_database["domain"].id)
+        zone_entry = domain_entry["value_streams"][0]["zones"][0]
+        assert zone_entry["zone"]["name"] == populated_database["zone"].name
+        assert zone_entry["vlans"][0]["subnet"] == "192.168.100.0"
+    
+    async def test_network_hierarchy_report_filtered(self, async_client: AsyncClient, populated_database):
+        """Test filtering the hierarchy report by an unknown domain returns no entries."""
+        response = await async_client.get("/api/v1/reports/network-hierarchy", params={"domain_id": str(uuid4())})
+        assert response.status_code == 200
+        assert response.json() == {"hierarchy": []}
+    
+    async def test_security_compliance_report(self, async_client: AsyncClient, populated_database):
+        """Test the summary compliance report."""
+        response = await async_client.get("/api/v1/reports/security-compliance")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["security_zones"]["MFZ_SL4"] == {"count": 1, "overdue": 1}
+        assert data["compliance_summary"] == {"total_zones": 1, "overdue_firewall_checks": 1}
+    
+    async def test_security_compliance_report_detailed(
+        self, async_client: AsyncClient, populated_database, firewall_check_zones
+    ):
+        """Test the detailed compliance report serializes per-zone checks around the overdue boundary."""
+        response = await async_client.get("/api/v1/reports/security-compliance", params={"detailed": True})
+        assert response.status_code == 200
+        
+        data = response.json()
+        overdue = {
+            check["zone_name"]: check["overdue"]
+            for check in data["security_zones"]["MFZ_SL4"]["last_firewall_checks"]
+        }
+        assert overdue == {
+            populated_database["zone"].name: True,  # Never checked
+            "Checked 31 days ago": True,
+            "Checked just under 31 days ago": False
+        }
+        assert data["compliance_summary"] == {"total_zones": 4, "overdue_firewall_checks": 2}
+
+
 class TestErrorHandling:
     """Test suite for API error handling."""
     
-    def test_404_not_found(self, test_client: TestClient):
+    async def test_404_not_found(self, async_client: AsyncClient):
         """Test 404 error handling."""
-        response = test_client.get("/api/v1/nonexistent")
+        response = await async_client.get("/api/v1/nonexistent")
         assert response.status_code == 404
     
-    def test_405_method_not_allowed(self, test_client: TestClient):
+    async def test_405_method_not_allowed(self, async_client: AsyncClient):
         """Test 405 error handling."""
-        response = test_client.patch("/api/v1/domains")  # PATCH not supported
+        response = await async_client.patch("/api/v1/domains")  # PATCH not supported
         assert response.status_code == 405
     
-    def test_422_validation_error(self, test_client: TestClient):
+    async def test_422_validation_error(self, async_client: AsyncClient):
         """Test validation error handling."""
         invalid_data = {"invalid": "data"}
-        response = test_client.post("/api/v1/domains", json=invalid_data)
+        response = await async_client.post("/api/v1/domains", json=invalid_data)
         assert response.status_code == 422
         
         error_data = response.json()
         assert "detail" in error_data
         assert isinstance(error_data["detail"], list)
     
-    def test_500_internal_server_error_handling(self, test_client: TestClient):
+    async def test_500_internal_server_error_handling(self, async_client: AsyncClient):
         """Test internal server error handling."""
         # This would require triggering an actual server error
         # Could be done by mocking database failures
@@ -319,61 +393,38 @@ class TestErrorHandling:
 class TestPerformanceAPI:
     """Test suite for API performance requirements."""
     
-    def test_response_time_domains(self, test_client: TestClient):
+    async def test_response_time_domains(self, async_client: AsyncClient, create_domains):
         """Test domain API response times."""
-        import time
-        
         # Create test data
-        for i in range(10):
-            domain_data = {
+        create_domains([
+            {
                 "code": f"TST{i:02d}",
                 "name": f"Test Domain {i}",
                 "description": f"Test domain {i}",
                 "is_active": True
             }
-            test_client.post("/api/v1/domains", json=domain_data)
+            for i in range(10)
+        ])
         
         # Test list performance
-        start_time = time.time()
-        response = test_client.get("/api/v1/domains")
-        end_time = time.time()
+        start_time = time.perf_counter()
+        response = await async_client.get("/api/v1/domains")
+        end_time = time.perf_counter()
         
         assert response.status_code == 200
         response_time = end_time - start_time
         assert response_time < 0.5, f"Domain list took {response_time:.3f}s, should be <0.5s"
     
-    def test_concurrent_requests(self, test_client: TestClient):
+    async def test_concurrent_requests(self, async_client: AsyncClient):
         """Test handling of concurrent API requests."""
-        import threading
-        import time
-        
-        results = []
-        
-        def make_request():
-            response = test_client.get("/health")
-            results.append(response.status_code)
-        
-        # Create multiple concurrent threads
-        threads = []
-        for i in range(10):
-            thread = threading.Thread(target=make_request)
-            threads.append(thread)
-        
-        # Start all threads
-        start_time = time.time()
-        for thread in threads:
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        end_time = time.time()
+        # Issue concurrent requests on the shared client
+        start_time = time.perf_counter()
+        responses = await asyncio.gather(*(async_client.get("/health") for _ in range(50)))
+        total_time = time.perf_counter() - start_time
         
         # All requests should succeed
-        assert all(status == 200 for status in results)
-        assert len(results) == 10
+        assert len(responses) == 50
+        assert all(response.status_code == 200 for response in responses)
         
         # Total time should be reasonable
-        total_time = end_time - start_time
         assert total_time < 2.0, f"Concurrent requests took {total_time:.3f}s"
\ No newline at end of file
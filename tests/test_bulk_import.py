@@ -0,0 +1,120 @@
+"""
+Tests for the async bulk IP assignment import.
+
+Runs ``BulkImportService`` against an in-memory aiosqlite database, covering
+chunked inserts, batch validation and rollback on conflicts with existing
+assignments.
+"""
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.sql import Insert
+
+from src.ip_management.services.bulk_import import BulkImportService
+from src.ip_management.models.database import IPAssignment
+from src.ip_management.models.schemas_io import IPAssignmentCreate
+from src.ip_management.models.exceptions import IPAllocationError, ReservedIPError
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def _make_ips(vlan_id, hosts):
+    """One assignment per host number in the sample 192.168.100.0/24 VLAN."""
+    return [
+        IPAssignmentCreate(
+            vlan_id=vlan_id,
+            ip_address=f"192.168.100.{host}",
+            mac_address=f"00:11:22:33:44:{host:02X}",
+            ci_name=f"DEVICE-{host:03d}"
+        )
+        for host in hosts
+    ]
+
+
+async def _assigned_ips(session_factory):
+    async with session_factory() as session:
+        result = await session.execute(select(IPAssignment.ip_address).order_by(IPAssignment.ip_address))
+        return list(result.scalars())
+
+
+class TestBulkImportService:
+    """Test suite for BulkImportService."""
+    
+    async def test_import_empty_batch(self, async_session_factory):
+        """Test an empty import is a no-op."""
+        async with async_session_factory() as session:
+            assert await BulkImportService(session).import_assignments([]) == 0
+    
+    async def test_import_inserts_in_chunks(self, async_engine, async_session_factory, async_vlan, monkeypatch):
+        """Test rows are sent in CHUNK_SIZE multi-row INSERTs."""
+        monkeypatch.setattr(BulkImportService, "CHUNK_SIZE", 2)
+        inserts = []
+        
+        def count_inserts(conn, clauseelement, multiparams, params, execution_options):
+            if isinstance(clauseelement, Insert):
+                inserts.append(clauseelement)
+        
+        event.listen(async_engine.sync_engine, "before_execute", count_inserts)
+        try:
+            async with async_session_factory() as session:
+                imported = await BulkImportService(session).import_assignments(
+                    _make_ips(async_vlan.id, range(10, 15))
+                )
+        finally:
+            event.remove(async_engine.sync_engine, "before_execute", count_inserts)
+        
+        assert imported == 5
+        assert len(inserts) == 3
+        assert await _assigned_ips(async_session_factory) == [f"192.168.100.{host}" for host in range(10, 15)]
+    
+    async def test_import_reserved_ip(self, async_session_factory, async_vlan):
+        """Test a reserved address rejects the whole batch."""
+        async with async_session_factory() as session:
+            with pytest.raises(ReservedIPError, match="192.168.100.3"):
+                await BulkImportService(session).import_assignments(_make_ips(async_vlan.id, [10, 3]))
+        
+        assert await _assigned_ips(async_session_factory) == []
+    
+    async def test_import_ip_outside_subnet(self, async_session_factory, async_vlan):
+        """Test an address outside the VLAN subnet rejects the whole batch."""
+        assignments = _make_ips(async_vlan.id, [10])
+        assignments.append(IPAssignmentCreate(vlan_id=async_vlan.id, ip_address="10.0.0.10", ci_name="OUTSIDE"))
+        
+        async with async_session_factory() as session:
+            with pytest.raises(IPAllocationError, match="not in VLAN subnet"):
+                await BulkImportService(session).import_assignments(assignments)
+        
+        assert await _assigned_ips(async_session_factory) == []
+    
+    async def test_import_duplicate_in_batch(self, async_session_factory, async_vlan):
+        """Test the same address twice in one batch is rejected before inserting."""
+        assignments = _make_ips(async_vlan.id, [10, 11])
+        assignments.append(IPAssignmentCreate(vlan_id=async_vlan.id, ip_address="192.168.100.11", ci_name="DUPLICATE"))
+        
+        async with async_session_factory() as session:
+            with pytest.raises(IPAllocationError, match="192.168.100.11 appears more than once"):
+                await BulkImportService(session).import_assignments(assignments)
+        
+        assert await _assigned_ips(async_session_factory) == []
+    
+    async def test_import_unknown_vlan(self, async_session_factory, async_vlan):
+        """Test a batch targeting a missing VLAN is rejected."""
+        # Any UUID that is not a VLAN id will do
+        assignments = _make_ips(async_vlan.zone_id, [10])
+        
+        async with async_session_factory() as session:
+            with pytest.raises(IPAllocationError, match="not found"):
+                await BulkImportService(session).import_assignments(assignments)
+    
+    async def test_import_conflict_rolls_back(self, async_session_factory, async_vlan, monkeypatch):
+        """Test a conflict in a later chunk rolls back the chunks already inserted."""
+        async with async_session_factory() as session:
+            await BulkImportService(session).import_assignments(_make_ips(async_vlan.id, [20]))
+        
+        monkeypatch.setattr(BulkImportService, "CHUNK_SIZE", 1)
+        async with async_session_factory() as session:
+            with pytest.raises(IPAllocationError, match="conflicts with existing assignments"):
+                await BulkImportService(session).import_assignments(_make_ips(async_vlan.id, [21, 20]))
+        
+        assert await _assigned_ips(async_session_factory) == ["192.168.100.20"]
@@ -7,13 +7,18 @@ according to Bosch Rexroth IT/OT network standards.
 
 import pytest
 import ipaddress
-from src.ip_management.core.ip_calculator import IPCalculator
-from src.ip_management.models.exceptions import InvalidSubnetError, InsufficientIPSpaceError
+from src.ip_management.core.ip_calculator import IPCalculator, int_to_ip, ip_to_int
+from src.ip_management.models.exceptions import (
+    InvalidSubnetError, InsufficientIPSpaceError, IPAllocationError
+)
 
 
 class TestIPCalculator:
     """Test suite for IP Calculator functionality."""
     
+    # Parsed once for the class; IPv4Network is immutable
+    NETWORK_24 = ipaddress.IPv4Network("192.168.1.0/24")
+    
     def setup_method(self):
         """Set up test fixtures."""
         self.calculator = IPCalculator()
@@ -65,16 +70,29 @@ class TestIPCalculator:
         with pytest.raises(InvalidSubnetError):
             self.calculator.calculate_subnet_info("192.168.1.0", "invalid.mask")
     
+    def test_calculate_subnet_info_host_bits_set(self):
+        """Test subnet calculation rejects a host address as the subnet."""
+        with pytest.raises(InvalidSubnetError, match="not the network address"):
+            self.calculator.calculate_subnet_info("192.168.1.1", "/24")
+    
+    def test_calculate_subnet_info_oversized_subnet(self):
+        """Test subnet calculation rejects subnets larger than the minimum prefix."""
+        with pytest.raises(InvalidSubnetError, match="too large"):
+            self.calculator.calculate_subnet_info("10.0.0.0", "/8")
+        
+        with pytest.raises(InvalidSubnetError, match="too large"):
+            self.calculator.calculate_subnet_info("0.0.0.0", "0.0.0.0")
+    
     def test_get_default_gateway(self):
         """Test default gateway calculation (first host IP)."""
-        network = ipaddress.IPv4Network("192.168.1.0/24")
+        network = self.NETWORK_24
         gateway = self.calculator.get_default_gateway(network)
         
         assert str(gateway) == "192.168.1.1"
     
     def test_get_net_start_end(self):
         """Test assignable IP range calculation."""
-        network = ipaddress.IPv4Network("192.168.1.0/24")
+        network = self.NETWORK_24
         start_ip, end_ip = self.calculator.get_net_start_end(network)
         
         assert str(start_ip) == "192.168.1.7"  # After 6 reserved IPs
@@ -82,32 +100,94 @@ class TestIPCalculator:
     
     def test_is_ip_assignable_valid(self):
         """Test IP assignability check for valid assignable IP."""
-        network = ipaddress.IPv4Network("192.168.1.0/24")
+        network = self.NETWORK_24
         ip = ipaddress.IPv4Address("192.168.1.10")
         
         assert self.calculator.is_ip_assignable(ip, network)
     
     def test_is_ip_assignable_reserved_start(self):
         """Test IP assignability check for reserved start IP."""
-        network = ipaddress.IPv4Network("192.168.1.0/24")
+        network = self.NETWORK_24
         ip = ipaddress.IPv4Address("192.168.1.3")  # Within first 6
         
         assert not self.calculator.is_ip_assignable(ip, network)
     
     def test_is_ip_assignable_reserved_end(self):
         """Test IP assignability check for reserved end IP."""
-        network = ipaddress.IPv4Network("192.168.1.0/24")
+        network = self.NETWORK_24
         ip = ipaddress.IPv4Address("192.168.1.254")  # Last IP
         
         assert not self.calculator.is_ip_assignable(ip, network)
     
     def test_is_ip_assignable_outside_network(self):
         """Test IP assignability check for IP outside network."""
-        network = ipaddress.IPv4Network("192.168.1.0/24")
+        network = self.NETWORK_24
         ip = ipaddress.IPv4Address("192.168.2.10")
         
         assert not self.calculator.is_ip_assignable(ip, network)
     
+    def test_is_ip_assignable_integer(self):
+        """Test IP assignability check accepts 32-bit integer addresses."""
+        network = self.NETWORK_24
+        
+        assert self.calculator.is_ip_assignable(int(ipaddress.IPv4Address("192.168.1.10")), network)
+        assert not self.calculator.is_ip_assignable(int(ipaddress.IPv4Address("192.168.1.3")), network)
+        assert not self.calculator.is_ip_assignable(int(ipaddress.IPv4Address("192.168.2.10")), network)
+    
+    def test_first_unassignable(self):
+        """Test bulk reserved-range check over validated integer addresses."""
+        network = self.NETWORK_24
+        
+        assert self.calculator.assignable_bounds(network) == (
+            int(ipaddress.IPv4Address("192.168.1.7")), int(ipaddress.IPv4Address("192.168.1.253"))
+        )
+        
+        ip_ints = self.calculator.validate_ip_batch(["192.168.1.10", "192.168.1.253"], network)
+        assert self.calculator.first_unassignable(ip_ints, network) is None
+        
+        ip_ints = self.calculator.validate_ip_batch(["192.168.1.10", "192.168.1.3", "192.168.1.254"], network)
+        assert self.calculator.first_unassignable(ip_ints, network) == 1
+        assert self.calculator.first_unassignable(list(ip_ints), network) == 1
+    
+    def test_validate_ip_batch_valid(self):
+        """Test batch validation returns addresses as 32-bit integers."""
+        network = self.NETWORK_24
+        ips = ["192.168.1.10", "192.168.1.11", "192.168.1.200"]
+        
+        result = self.calculator.validate_ip_batch(ips, network)
+        
+        assert [int(i) for i in result] == [int(ipaddress.IPv4Address(ip)) for ip in ips]
+    
+    def test_validate_ip_batch_outside_network(self):
+        """Test batch validation rejects IPs outside the network."""
+        network = self.NETWORK_24
+        
+        with pytest.raises(IPAllocationError, match="192.168.2.10 not in VLAN subnet"):
+            self.calculator.validate_ip_batch(["192.168.1.10", "192.168.2.10"], network)
+    
+    def test_validate_ip_batch_duplicates(self):
+        """Test batch validation rejects duplicate IPs within a batch."""
+        network = self.NETWORK_24
+        
+        with pytest.raises(IPAllocationError, match="192.168.1.10 appears more than once"):
+            self.calculator.validate_ip_batch(["192.168.1.10", "192.168.1.10"], network)
+    
+    def test_first_free_address(self):
+        """Test lowest free address lookup over sorted pages of assigned IPs."""
+        assert self.calculator.first_free_address(10, 20, []) == 10
+        assert self.calculator.first_free_address(10, 20, [[11, 12]]) == 10
+        assert self.calculator.first_free_address(10, 20, [[10, 11], [12, 14, 15]]) == 13
+        assert self.calculator.first_free_address(10, 20, [[10, 11], [13]]) == 12
+        assert self.calculator.first_free_address(10, 12, [[10, 11], [12]]) is None
+    
+    def test_ip_int_round_trip(self):
+        """Test dotted-quad/integer conversion helpers."""
+        assert ip_to_int("192.168.1.10") == int(ipaddress.IPv4Address("192.168.1.10"))
+        assert int_to_ip(ip_to_int("10.0.255.253")) == "10.0.255.253"
+        
+        with pytest.raises(OSError):
+            ip_to_int("invalid.ip")
+    
     def test_validate_vlan_configuration_valid(self):
         """Test complete VLAN configuration validation."""
         result = self.calculator.validate_vlan_configuration(100, "192.168.1.0", "/24")
@@ -120,6 +200,7 @@ class TestIPCalculator:
         assert result["net_start"] == "192.168.1.7"
         assert result["net_end"] == "192.168.1.253"
         assert result["total_ips"] == 254  # Excluding network and broadcast
+        assert result["assignable_ips"] == 247  # .7 through .253
         assert len(result["reserved_ranges"]) == 2  # Start and end ranges
     
     def test_validate_vlan_configuration_invalid_vlan_id(self):
@@ -143,13 +224,18 @@ class TestIPCalculator:
         assert str(assignable.end_ip) == "10.0.255.253"
     
     def test_minimum_viable_subnet(self):
-        """Test calculation with minimum viable subnet (/29)."""
-        network, ranges = self.calculator.calculate_subnet_info("192.168.1.0", "/29")
+        """Test calculation with minimum viable subnet (/28)."""
+        network, ranges = self.calculator.calculate_subnet_info("192.168.1.0", "/28")
         
-        assert str(network) == "192.168.1.0/29"
+        assert str(network) == "192.168.1.0/28"
         assert len(ranges) == 3
         
-        # Should have exactly 1 assignable IP (6 reserved + 1 assignable + 1 reserved = 8 total)
+        # 14 hosts: 6 reserved at the start, 1 at the end, 7 assignable in between
         assignable = ranges[1]
         assert str(assignable.start_ip) == "192.168.1.7"
-        assert str(assignable.end_ip) == "192.168.1.7"
\ No newline at end of file
+        assert str(assignable.end_ip) == "192.168.1.13"
+    
+    def test_subnet_below_minimum_rejected(self):
+        """Test a /29 is rejected: its 6 hosts are all reserved."""
+        with pytest.raises(InsufficientIPSpaceError, match="only provides 6"):
+            self.calculator.calculate_subnet_info("192.168.1.0", "/29")
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+Tests for the reporting service functions.
+
+Covers the network hierarchy report and the security compliance report
+used for Bosch Rexroth IT/OT security audits.
+"""
+
+from src.ip_management.services.ip_service import IPManagementService
+
+
+class TestSecurityComplianceReport:
+    """Test suite for the security compliance report."""
+    
+    def test_report_counts_by_security_type(self, ip_service: IPManagementService, firewall_check_zones):
+        """Test zones are counted per security type, including empty types."""
+        report = ip_service.get_security_compliance_report()
+        
+        zones = report["security_zones"]
+        assert zones["MFZ_SL4"]["count"] == 3
+        assert zones["ENG_SL4"]["count"] == 1
+        assert zones["SL3"] == {"count": 0, "overdue": 0}
+        assert report["compliance_summary"]["total_zones"] == 4
+    
+    def test_report_overdue_boundary(self, ip_service: IPManagementService, firewall_check_zones):
+        """Test never-checked zones and checks 31 or more days old are overdue."""
+        report = ip_service.get_security_compliance_report()
+        
+        # Fixture zone (never checked) + "Checked 31 days ago"
+        assert report["security_zones"]["MFZ_SL4"]["overdue"] == 2
+        assert report["security_zones"]["ENG_SL4"]["overdue"] == 0
+        assert report["compliance_summary"]["overdue_firewall_checks"] == 2
+    
+    def test_report_summary_only_by_default(self, ip_service: IPManagementService, firewall_check_zones):
+        """Test per-zone details are only included when requested."""
+        report = ip_service.get_security_compliance_report()
+        
+        assert "last_firewall_checks" not in report["security_zones"]["MFZ_SL4"]
+    
+    def test_report_detailed(self, ip_service: IPManagementService, populated_database, firewall_check_zones):
+        """Test detailed report lists each zone's check as plain values."""
+        report = ip_service.get_security_compliance_report(detailed=True)
+        
+        checks = {
+            check["zone_name"]: check
+            for check in report["security_zones"]["MFZ_SL4"]["last_firewall_checks"]
+        }
+        assert checks[populated_database["zone"].name] == {
+            "zone_name": populated_database["zone"].name,
+            "last_check": None,
+            "overdue": True
+        }
+        assert checks["Checked 31 days ago"]["overdue"] is True
+        assert checks["Checked just under 31 days ago"]["overdue"] is False
+        assert report["security_zones"]["ENG_SL4"]["last_firewall_checks"][0]["overdue"] is False
+        assert report["security_zones"]["SL3"]["last_firewall_checks"] == []
+        assert "zones" not in report["security_zones"]["MFZ_SL4"]
+
+
+class TestNetworkHierarchyReport:
+    """Test suite for the network hierarchy report."""
+    
+    def test_hierarchy_report_plain_values(self, ip_service: IPManagementService, populated_database):
+        """Test every level of the hierarchy is a plain dict of report columns."""
+        report = ip_service.get_network_hierarchy()
+        
+        domain_entry = report["hierarchy"][0]
+        assert domain_entry["domain"] == {
+            "id": populated_database["domain"].id,
+            "code": "MFG",
+            "name": "Manufacturing",
+            "is_active": True
+        }
+        vs_entry = domain_entry["value_streams"][0]
+        assert vs_entry["value_stream"]["code"] == "A2"
+        zone_entry = vs_entry["zones"][0]
+        assert zone_entry["zone"]["security_type"] == "MFZ_SL4"
+        assert zone_entry["vlans"] == [{
+            "id": populated_database["vlan"].id,
+            "vlan_id": 100,
+            "subnet": "192.168.100.0",
+            "netmask": "255.255.255.0",
+            "is_active": True
+        }]
+    
+    def test_hierarchy_report_domain_without_children(self, ip_service: IPManagementService, create_domains):
+        """Test domains without value streams are still listed."""
+        create_domains([{"code": "LOG", "name": "Logistics", "is_active": True}])
+        
+        report = ip_service.get_network_hierarchy()
+        
+        assert report["hierarchy"][0]["domain"]["code"] == "LOG"
+        assert report["hierarchy"][0]["value_streams"] == []
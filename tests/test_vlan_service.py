@@ -5,35 +5,56 @@ Tests VLAN creation, IP allocation, network validation according to
 Bosch Rexroth IT/OT network segmentation requirements.
 """
 
+import time
+
 import pytest
-import asyncio
-from uuid import uuid4
-from ipaddress import IPv4Network, IPv4Address
+from uuid import UUID
 
 from src.ip_management.services.ip_service import IPManagementService
-from src.ip_management.models.schemas import VLANCreate, VLANUpdate, IPAssignmentCreate
-from src.ip_management.models.exceptions import VLANConfigurationError, InvalidSubnetError
+from src.ip_management.models.schemas_io import VLANCreate, IPAssignmentCreate
+from src.ip_management.models.exceptions import (
+    IPAllocationError, InvalidSubnetError, ReservedIPError, VLANConfigurationError
+)
+
+
+# Validated once; tests copy these with overrides instead of rebuilding the dicts
+# VLAN 100 is the ``populated_database`` fixture's own VLAN
+_BASE_VLAN = VLANCreate(
+    zone_id=UUID(int=0),
+    vlan_id=200,
+    subnet="10.1.1.0",
+    netmask="/24",
+    description="Test VLAN",
+    is_active=True
+)
+_BASE_IP = IPAssignmentCreate(
+    vlan_id=UUID(int=0),
+    ip_address="192.168.100.10",
+    mac_address="00:11:22:33:44:55",
+    ci_name="TEST-DEVICE",
+    description="Test device",
+    is_active=True
+)
+
+
+def _make_vlan(**overrides) -> VLANCreate:
+    """Copy of the base VLAN payload; overrides skip validation, so pass valid values."""
+    return _BASE_VLAN.model_copy(update=overrides)
+
+
+def _make_ip(**overrides) -> IPAssignmentCreate:
+    """Copy of the base IP assignment payload; overrides skip validation, so pass valid values."""
+    return _BASE_IP.model_copy(update=overrides)
 
 
 class TestVLANService:
     """Test suite for VLAN Service operations."""
     
-    @pytest.mark.asyncio
-    async def test_create_vlan_success(self, ip_service: IPManagementService, populated_database):
+    def test_create_vlan_success(self, ip_service: IPManagementService, populated_database):
         """Test successful VLAN creation with automatic IP calculation."""
         zone = populated_database["zone"]
         
-        vlan_data = {
-            "zone_id": zone.id,
-            "vlan_id": 200,
-            "subnet": "10.1.1.0",
-            "netmask": "/24",
-            "description": "Test VLAN for manufacturing",
-            "is_active": True
-        }
-        
-        vlan_create = VLANCreate(**vlan_data)
-        vlan = await ip_service.create_vlan(vlan_create)
+        vlan = ip_service.create_vlan(_make_vlan(zone_id=zone.id, vlan_id=200))
         
         assert vlan.vlan_id == 200
         assert vlan.subnet == "10.1.1.0"
@@ -45,119 +66,72 @@ class TestVLANService:
         assert vlan.assignable_ips == 247  # 254 - 6 - 1 = 247
         assert vlan.zone_id == zone.id
     
-    @pytest.mark.asyncio
-    async def test_create_vlan_duplicate_id_same_zone(self, ip_service: IPManagementService, populated_database):
+    def test_create_vlan_duplicate_id_same_zone(self, ip_service: IPManagementService, populated_database):
         """Test VLAN creation with duplicate VLAN ID in same zone fails."""
         zone = populated_database["zone"]
         
-        vlan_data = {
-            "zone_id": zone.id,
-            "vlan_id": 100,
-            "subnet": "10.1.1.0",
-            "netmask": "/24",
-            "description": "First VLAN",
-            "is_active": True
-        }
-        
         # Create first VLAN
-        vlan_create = VLANCreate(**vlan_data)
-        await ip_service.create_vlan(vlan_create)
+        ip_service.create_vlan(_make_vlan(zone_id=zone.id, vlan_id=210))
         
         # Attempt to create duplicate VLAN ID in same zone
-        duplicate_data = {**vlan_data, "subnet": "10.1.2.0", "description": "Duplicate VLAN"}
-        duplicate_create = VLANCreate(**duplicate_data)
+        duplicate_create = _make_vlan(zone_id=zone.id, vlan_id=210, subnet="10.1.2.0")
         
-        with pytest.raises(VLANConfigurationError, match="VLAN ID 100 already exists"):
-            await ip_service.create_vlan(duplicate_create)
+        with pytest.raises(VLANConfigurationError, match="VLAN ID 210 already exists"):
+            ip_service.create_vlan(duplicate_create)
     
-    @pytest.mark.asyncio
-    async def test_create_vlan_invalid_vlan_id(self, ip_service: IPManagementService, populated_database):
+    @pytest.mark.parametrize("invalid_id", [0, -1, 4095, 5000])
+    def test_create_vlan_invalid_vlan_id(self, ip_service: IPManagementService, populated_database, invalid_id):
         """Test VLAN creation with invalid VLAN ID."""
         zone = populated_database["zone"]
         
-        invalid_vlan_ids = [0, -1, 4095, 5000]
-        
-        for invalid_id in invalid_vlan_ids:
-            vlan_data = {
-                "zone_id": zone.id,
-                "vlan_id": invalid_id,
-                "subnet": "10.1.1.0",
-                "netmask": "/24",
-                "description": f"Invalid VLAN {invalid_id}",
-                "is_active": True
-            }
-            
-            with pytest.raises((VLANConfigurationError, ValueError)):
-                vlan_create = VLANCreate(**vlan_data)
-                await ip_service.create_vlan(vlan_create)
+        # Built with the constructor so the schema validators run
+        vlan_data = {**_BASE_VLAN.model_dump(), "zone_id": zone.id, "vlan_id": invalid_id}
+        
+        with pytest.raises((VLANConfigurationError, ValueError)):
+            vlan_create = VLANCreate(**vlan_data)
+            ip_service.create_vlan(vlan_create)
     
-    @pytest.mark.asyncio
-    async def test_create_vlan_invalid_subnet(self, ip_service: IPManagementService, populated_database):
+    @pytest.mark.parametrize("subnet, netmask", [
+        ("invalid.subnet", "/24"),
+        ("192.168.1.0", "/33"),  # Invalid CIDR
+        ("192.168.1.0", "/30"),  # Too small (insufficient IP space)
+        ("192.168.1.1", "/24"),  # Not network address
+    ])
+    def test_create_vlan_invalid_subnet(self, ip_service: IPManagementService, populated_database, subnet, netmask):
         """Test VLAN creation with invalid subnet configurations."""
         zone = populated_database["zone"]
         
-        invalid_subnets = [
-            ("invalid.subnet", "/24"),
-            ("192.168.1.0", "/33"),  # Invalid CIDR
-            ("192.168.1.0", "/30"),  # Too small (insufficient IP space)
-            ("192.168.1.1", "/24"),  # Not network address
-        ]
-        
-        for subnet, netmask in invalid_subnets:
-            vlan_data = {
-                "zone_id": zone.id,
-                "vlan_id": 100,
-                "subnet": subnet,
-                "netmask": netmask,
-                "description": "Invalid subnet test",
-                "is_active": True
-            }
-            
-            with pytest.raises((InvalidSubnetError, VLANConfigurationError)):
-                vlan_create = VLANCreate(**vlan_data)
-                await ip_service.create_vlan(vlan_create)
+        # Built with the constructor so the schema validators run
+        vlan_data = {**_BASE_VLAN.model_dump(), "zone_id": zone.id, "subnet": subnet, "netmask": netmask}
+        
+        with pytest.raises((InvalidSubnetError, VLANConfigurationError, ValueError)):
+            vlan_create = VLANCreate(**vlan_data)
+            ip_service.create_vlan(vlan_create)
     
-    @pytest.mark.asyncio
-    async def test_create_vlan_performance_requirement(self, ip_service: IPManagementService, populated_database):
+    def test_create_vlan_performance_requirement(self, ip_service: IPManagementService, populated_database):
         """Test VLAN creation meets <1 second performance requirement."""
-        import time
-        
         zone = populated_database["zone"]
         
-        vlan_data = {
+        start_time = time.perf_counter()
+        vlan_create = VLANCreate(**{
+            **_BASE_VLAN.model_dump(),
             "zone_id": zone.id,
             "vlan_id": 300,
             "subnet": "10.3.0.0",
-            "netmask": "/16",  # Large subnet for performance test
-            "description": "Performance test VLAN",
-            "is_active": True
-        }
-        
-        start_time = time.time()
-        vlan_create = VLANCreate(**vlan_data)
-        vlan = await ip_service.create_vlan(vlan_create)
-        end_time = time.time()
+            "netmask": "/16"  # Large subnet for performance test
+        })
+        vlan = ip_service.create_vlan(vlan_create)
+        end_time = time.perf_counter()
         
         creation_time = end_time - start_time
         assert creation_time < 1.0, f"VLAN creation took {creation_time:.3f}s, exceeds 1s requirement"
         assert vlan.assignable_ips == 65527  # /16 network minus reserved IPs
     
-    @pytest.mark.asyncio
-    async def test_assign_ip_success(self, ip_service: IPManagementService, populated_database):
+    def test_assign_ip_success(self, ip_service: IPManagementService, populated_database):
         """Test successful IP assignment within VLAN range."""
         vlan = populated_database["vlan"]
         
-        ip_data = {
-            "vlan_id": vlan.id,
-            "ip_address": "192.168.100.10",
-            "mac_address": "00:11:22:33:44:55",
-            "ci_name": "TEST-DEVICE-001",
-            "description": "Test device for IP assignment",
-            "is_active": True
-        }
-        
-        ip_create = IPAssignmentCreate(**ip_data)
-        assignment = await ip_service.assign_ip(ip_create)
+        assignment = ip_service.assign_ip(_make_ip(vlan_id=vlan.id, ci_name="TEST-DEVICE-001"))
         
         assert assignment.ip_address == "192.168.100.10"
         assert assignment.mac_address == "00:11:22:33:44:55"
@@ -165,8 +139,7 @@ class TestVLANService:
         assert assignment.vlan_id == vlan.id
         assert assignment.is_active == True
     
-    @pytest.mark.asyncio
-    async def test_assign_ip_reserved_range(self, ip_service: IPManagementService, populated_database):
+    def test_assign_ip_reserved_range(self, ip_service: IPManagementService, populated_database):
         """Test IP assignment in reserved range fails."""
         vlan = populated_database["vlan"]
         
@@ -174,189 +147,145 @@ class TestVLANService:
         reserved_ips = ["192.168.100.1", "192.168.100.2", "192.168.100.6"]
         
         for reserved_ip in reserved_ips:
-            ip_data = {
-                "vlan_id": vlan.id,
-                "ip_address": reserved_ip,
-                "mac_address": "00:11:22:33:44:55",
-                "ci_name": "TEST-DEVICE-RESERVED",
-                "description": "Test reserved IP assignment",
-                "is_active": True
-            }
-            
-            with pytest.raises(VLANConfigurationError, match="IP address .* is in reserved range"):
-                ip_create = IPAssignmentCreate(**ip_data)
-                await ip_service.assign_ip(ip_create)
+            with pytest.raises(ReservedIPError, match=f"IP {reserved_ip} is reserved"):
+                ip_service.assign_ip(_make_ip(vlan_id=vlan.id, ip_address=reserved_ip))
         
         # Try to assign last IP (reserved end range)
-        ip_data = {
-            "vlan_id": vlan.id,
-            "ip_address": "192.168.100.254",
-            "mac_address": "00:11:22:33:44:55",
-            "ci_name": "TEST-DEVICE-LAST",
-            "description": "Test last IP assignment",
-            "is_active": True
-        }
-        
-        with pytest.raises(VLANConfigurationError, match="IP address .* is in reserved range"):
-            ip_create = IPAssignmentCreate(**ip_data)
-            await ip_service.assign_ip(ip_create)
+        with pytest.raises(ReservedIPError, match="IP 192.168.100.254 is reserved"):
+            ip_service.assign_ip(_make_ip(vlan_id=vlan.id, ip_address="192.168.100.254"))
     
-    @pytest.mark.asyncio
-    async def test_assign_ip_duplicate(self, ip_service: IPManagementService, populated_database):
+    def test_assign_ip_duplicate(self, ip_service: IPManagementService, populated_database):
         """Test duplicate IP assignment fails."""
         vlan = populated_database["vlan"]
         
-        ip_data = {
-            "vlan_id": vlan.id,
-            "ip_address": "192.168.100.10",
-            "mac_address": "00:11:22:33:44:55",
-            "ci_name": "FIRST-DEVICE",
-            "description": "First device",
-            "is_active": True
-        }
-        
         # Create first assignment
-        ip_create = IPAssignmentCreate(**ip_data)
-        await ip_service.assign_ip(ip_create)
+        ip_service.assign_ip(_make_ip(vlan_id=vlan.id, ci_name="FIRST-DEVICE"))
         
         # Attempt duplicate assignment
-        duplicate_data = {**ip_data, "mac_address": "00:11:22:33:44:66", "ci_name": "SECOND-DEVICE"}
-        duplicate_create = IPAssignmentCreate(**duplicate_data)
+        duplicate_create = _make_ip(vlan_id=vlan.id, mac_address="00:11:22:33:44:66", ci_name="SECOND-DEVICE")
+        
+        with pytest.raises(IPAllocationError, match="IP 192.168.100.10 already assigned"):
+            ip_service.assign_ip(duplicate_create)
+    
+    def test_assign_ip_duplicate_mac(self, ip_service: IPManagementService, populated_database):
+        """Test assigning a second IP to an already used MAC address fails."""
+        vlan = populated_database["vlan"]
+        
+        ip_service.assign_ip(_make_ip(vlan_id=vlan.id, ci_name="FIRST-DEVICE"))
         
-        with pytest.raises(VLANConfigurationError, match="IP address .* is already assigned"):
-            await ip_service.assign_ip(duplicate_create)
+        with pytest.raises(IPAllocationError, match="MAC address 00:11:22:33:44:55 already assigned"):
+            ip_service.assign_ip(_make_ip(vlan_id=vlan.id, ip_address="192.168.100.11", ci_name="SECOND-DEVICE"))
     
-    @pytest.mark.asyncio
-    async def test_assign_ip_invalid_mac_address(self, ip_service: IPManagementService, populated_database):
+    @pytest.mark.parametrize("invalid_mac", [
+        "invalid-mac",
+        "00:11:22:33:44",  # Too short
+        "00:11:22:33:44:55:66",  # Too long
+        "GG:11:22:33:44:55",  # Invalid hex
+        "00 1122 3344",  # Whitespace-padded to 12 characters
+    ])
+    def test_assign_ip_invalid_mac_address(self, ip_service: IPManagementService, populated_database, invalid_mac):
         """Test IP assignment with invalid MAC address formats."""
         vlan = populated_database["vlan"]
         
-        invalid_macs = [
-            "invalid-mac",
-            "00:11:22:33:44",  # Too short
-            "00:11:22:33:44:55:66",  # Too long
-            "GG:11:22:33:44:55",  # Invalid hex
-            "00-11-22-33-44-55",  # Wrong separator
-        ]
-        
-        for invalid_mac in invalid_macs:
-            ip_data = {
-                "vlan_id": vlan.id,
-                "ip_address": "192.168.100.10",
-                "mac_address": invalid_mac,
-                "ci_name": "TEST-DEVICE",
-                "description": "Invalid MAC test",
-                "is_active": True
-            }
-            
-            with pytest.raises((ValueError, VLANConfigurationError)):
-                ip_create = IPAssignmentCreate(**ip_data)
-                await ip_service.assign_ip(ip_create)
+        # Built with the constructor so the MAC validator runs
+        ip_data = {**_BASE_IP.model_dump(), "vlan_id": vlan.id, "mac_address": invalid_mac}
+        
+        with pytest.raises((ValueError, VLANConfigurationError)):
+            ip_create = IPAssignmentCreate(**ip_data)
+            ip_service.assign_ip(ip_create)
     
-    @pytest.mark.asyncio
-    async def test_get_vlan_utilization(self, ip_service: IPManagementService, populated_database):
+    @pytest.mark.parametrize("mac", [
+        "00-11-22-33-44-55",
+        "0011.2233.4455",
+        "001122334455",
+    ])
+    def test_assign_ip_mac_address_normalized(self, ip_service: IPManagementService, populated_database, mac):
+        """Test dash, dot and bare MAC notations are stored colon-separated."""
+        vlan = populated_database["vlan"]
+        
+        ip_data = {**_BASE_IP.model_dump(), "vlan_id": vlan.id, "mac_address": mac}
+        assignment = ip_service.assign_ip(IPAssignmentCreate(**ip_data))
+        
+        assert assignment.mac_address == "00:11:22:33:44:55"
+    
+    def test_get_vlan_utilization(self, ip_service: IPManagementService, populated_database):
         """Test VLAN utilization calculation."""
         vlan = populated_database["vlan"]
         
-        # Assign multiple IPs
-        for i in range(10, 15):
-            ip_data = {
-                "vlan_id": vlan.id,
-                "ip_address": f"192.168.100.{i}",
-                "mac_address": f"00:11:22:33:44:{i:02x}",
-                "ci_name": f"DEVICE-{i:03d}",
-                "description": f"Test device {i}",
-                "is_active": True
-            }
-            ip_create = IPAssignmentCreate(**ip_data)
-            await ip_service.assign_ip(ip_create)
+        # Assign multiple IPs in one batch
+        ip_service.assign_ips_bulk([
+            _make_ip(
+                vlan_id=vlan.id,
+                ip_address=f"192.168.100.{i}",
+                mac_address=f"00:11:22:33:44:{i:02X}",
+                ci_name=f"DEVICE-{i:03d}"
+            )
+            for i in range(10, 15)
+        ])
         
         # Get utilization
-        utilization = await ip_service.get_vlan_utilization(vlan.id)
+        availability = ip_service.get_ip_availability(vlan.id)
+        
+        assert availability.vlan_id == vlan.id
+        assert availability.total_ips == vlan.total_ips
+        assert availability.reserved_ips == vlan.total_ips - vlan.assignable_ips
+        assert availability.assigned_ips == 5
+        assert availability.available_ips == vlan.assignable_ips - 5
+        assert availability.utilization_percentage == round(5 / vlan.assignable_ips * 100, 2)
+    
+    def test_get_next_available_ip(self, ip_service: IPManagementService, populated_database):
+        """Test the next free IP skips the reserved head and assigned addresses."""
+        vlan = populated_database["vlan"]
+        
+        assert ip_service.get_next_available_ip(vlan.id) == vlan.net_start
         
-        assert utilization["total_ips"] == vlan.total_ips
-        assert utilization["assignable_ips"] == vlan.assignable_ips
-        assert utilization["assigned_ips"] == 5
-        assert utilization["available_ips"] == vlan.assignable_ips - 5
-        assert utilization["utilization_percentage"] == (5 / vlan.assignable_ips) * 100
+        ip_service.assign_ips_bulk([
+            _make_ip(
+                vlan_id=vlan.id,
+                ip_address=f"192.168.100.{i}",
+                mac_address=f"00:11:22:33:44:{i:02X}",
+                ci_name=f"DEVICE-{i:03d}"
+            )
+            for i in (7, 8, 10)
+        ])
+        
+        assert ip_service.get_next_available_ip(vlan.id) == "192.168.100.9"
     
-    @pytest.mark.asyncio
-    async def test_vlan_security_type_validation(self, ip_service: IPManagementService, populated_database):
+    def test_vlan_security_type_validation(self, ip_service: IPManagementService, populated_database):
         """Test VLAN creation respects zone security types."""
         zone = populated_database["zone"]
         
         # Test that VLAN inherits security constraints from zone
-        vlan_data = {
-            "zone_id": zone.id,
-            "vlan_id": 400,
-            "subnet": "10.4.0.0",
-            "netmask": "/24",
-            "description": "Security test VLAN",
-            "is_active": True
-        }
-        
-        vlan_create = VLANCreate(**vlan_data)
-        vlan = await ip_service.create_vlan(vlan_create)
+        vlan = ip_service.create_vlan(_make_vlan(zone_id=zone.id, vlan_id=400, subnet="10.4.0.0"))
         
         # Verify VLAN has reference to zone security type
         assert vlan.zone.security_type == zone.security_type
     
-    @pytest.mark.asyncio
-    async def test_concurrent_ip_assignment(self, ip_service: IPManagementService, populated_database):
-        """Test concurrent IP assignments to same address."""
+    def test_repeated_ip_assignment_same_address(self, ip_service: IPManagementService, populated_database):
+        """Test repeated sequential assignments of one address: only the first succeeds."""
         vlan = populated_database["vlan"]
         
-        # Create multiple concurrent tasks trying to assign same IP
-        tasks = []
-        for i in range(5):
-            ip_data = {
-                "vlan_id": vlan.id,
-                "ip_address": "192.168.100.50",
-                "mac_address": f"00:11:22:33:44:{i:02x}",
-                "ci_name": f"DEVICE-{i}",
-                "description": f"Concurrent test device {i}",
-                "is_active": True
-            }
-            ip_create = IPAssignmentCreate(**ip_data)
-            task = asyncio.create_task(ip_service.assign_ip(ip_create))
-            tasks.append(task)
-        
-        # Only one should succeed, others should fail
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        success_count = sum(1 for r in results if not isinstance(r, Exception))
-        error_count = sum(1 for r in results if isinstance(r, Exception))
-        
-        assert success_count == 1
-        assert error_count == 4
+        ip_service.assign_ip(_make_ip(vlan_id=vlan.id, ip_address="192.168.100.50", ci_name="DEVICE-0"))
+        
+        # Each retry uses a fresh MAC, so only the IP conflict can reject it
+        for i in range(1, 5):
+            with pytest.raises(IPAllocationError, match=r"IP 192\.168\.100\.50 already assigned"):
+                ip_service.assign_ip(_make_ip(
+                    vlan_id=vlan.id,
+                    ip_address="192.168.100.50",
+                    mac_address=f"00:11:22:33:44:{i:02X}",
+                    ci_name=f"DEVICE-{i}"
+                ))
     
-    @pytest.mark.asyncio
-    async def test_vlan_network_overlap_detection(self, ip_service: IPManagementService, populated_database):
+    def test_vlan_network_overlap_detection(self, ip_service: IPManagementService, populated_database):
         """Test detection of overlapping VLAN networks."""
         zone = populated_database["zone"]
         
         # Create first VLAN
-        vlan1_data = {
-            "zone_id": zone.id,
-            "vlan_id": 500,
-            "subnet": "10.5.0.0",
-            "netmask": "/24",
-            "description": "First VLAN",
-            "is_active": True
-        }
-        vlan1_create = VLANCreate(**vlan1_data)
-        await ip_service.create_vlan(vlan1_create)
-        
-        # Attempt to create overlapping VLAN
-        overlapping_data = {
-            "zone_id": zone.id,
-            "vlan_id": 501,
-            "subnet": "10.5.0.0",  # Same subnet
-            "netmask": "/25",      # Different mask but overlapping
-            "description": "Overlapping VLAN",
-            "is_active": True
-        }
+        ip_service.create_vlan(_make_vlan(zone_id=zone.id, vlan_id=500, subnet="10.5.0.0"))
+        
+        # Attempt to create overlapping VLAN (same subnet, different mask)
+        overlapping_create = _make_vlan(zone_id=zone.id, vlan_id=501, subnet="10.5.0.0", netmask="/25")
         
         with pytest.raises(VLANConfigurationError, match="Network overlap detected"):
-            overlapping_create = VLANCreate(**overlapping_data)
-            await ip_service.create_vlan(overlapping_create)
\ No newline at end of file
+            ip_service.create_vlan(overlapping_create)
\ No newline at end of file